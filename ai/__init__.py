@@ -1,7 +1,8 @@
 """
 Connect Four AI package
 """
-from .game_state import create_empty_board, copy_board, get_valid_moves, get_drop_row, drop_piece, check_win, is_board_full, is_terminal
+from .game_state import create_empty_board, copy_board, get_valid_moves, get_valid_moves_with_rows, get_drop_row, drop_piece, check_win, is_board_full, is_terminal, pack_board, unpack_board
+from .bitboard import board_to_bitboards, bitboards_to_board, is_win, get_valid_moves_bb
 from .heuristic import evaluate_board
 from .minimax import minimax_without_ab, minimax_with_ab, MinimaxStats
 from .iterative_deepening import iterative_deepening
@@ -10,11 +11,18 @@ __all__ = [
     'create_empty_board',
     'copy_board',
     'get_valid_moves',
+    'get_valid_moves_with_rows',
     'get_drop_row',
     'drop_piece',
     'check_win',
     'is_board_full',
     'is_terminal',
+    'pack_board',
+    'unpack_board',
+    'board_to_bitboards',
+    'bitboards_to_board',
+    'is_win',
+    'get_valid_moves_bb',
     'evaluate_board',
     'minimax_without_ab',
     'minimax_with_ab',
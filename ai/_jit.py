@@ -0,0 +1,21 @@
+"""
+Optional Numba acceleration for the AI hot paths
+
+Numba is not a hard dependency: when it is installed, njit compiles the
+decorated integer kernels to native code; otherwise the decorator is a
+no-op and the pure-Python implementations run unchanged.
+"""
+try:
+    from numba import njit
+    HAVE_NUMBA = True
+except ImportError:
+    HAVE_NUMBA = False
+
+    def njit(*args, **kwargs):
+        """No-op stand-in for numba.njit when Numba is not installed"""
+        if args and callable(args[0]):
+            return args[0]
+
+        def decorator(func):
+            return func
+        return decorator
@@ -0,0 +1,147 @@
+"""
+Bitboard representation for Connect Four
+
+Each player's pieces are packed into a single integer using 7 bits per
+column (6 playable rows plus one sentinel bit on top). Bit (col * 7 + row)
+is set when that square is occupied, with row 0 at the bottom of the
+column. Copying a position is just copying two ints, and win detection
+collapses to four shift-and masks instead of scanning the board.
+"""
+from .game_state import COLS, ROWS
+from ._jit import njit
+
+BITS_PER_COL = ROWS + 1  # 6 playable rows + 1 sentinel bit
+
+# Mask of the bottom cell of every column
+BOTTOM_MASK = sum(1 << (col * BITS_PER_COL) for col in range(COLS))
+
+# Mask of all playable cells (excludes the sentinel row)
+BOARD_MASK = BOTTOM_MASK * ((1 << ROWS) - 1)
+
+# Mask of the top playable cell of every column (used for valid-move tests)
+TOP_MASK = sum(1 << (col * BITS_PER_COL + ROWS - 1) for col in range(COLS))
+
+def empty_bitboards():
+    """Return the bitboards for an empty board as (player1, player2)"""
+    return (0, 0)
+
+def board_to_bitboards(board):
+    """Convert a list-of-lists board to (bb_player1, bb_player2)"""
+    bb1 = 0
+    bb2 = 0
+    for row in range(ROWS):
+        for col in range(COLS):
+            cell = board[row][col]
+            if cell == 0:
+                continue
+            # List boards store row 0 at the top; bitboards store bit-row 0
+            # at the bottom of the column
+            bit = 1 << (col * BITS_PER_COL + (ROWS - 1 - row))
+            if cell == 1:
+                bb1 |= bit
+            else:
+                bb2 |= bit
+    return (bb1, bb2)
+
+def bitboards_to_board(bb1, bb2):
+    """Convert (bb_player1, bb_player2) back to a list-of-lists board"""
+    board = [[0 for _ in range(COLS)] for _ in range(ROWS)]
+    for row in range(ROWS):
+        for col in range(COLS):
+            bit = 1 << (col * BITS_PER_COL + (ROWS - 1 - row))
+            if bb1 & bit:
+                board[row][col] = 1
+            elif bb2 & bit:
+                board[row][col] = 2
+    return board
+
+def get_heights(bb1, bb2):
+    """Get the number of pieces in each column as a list of COLS ints"""
+    occupied = bb1 | bb2
+    return [((occupied >> (col * BITS_PER_COL)) & ((1 << ROWS) - 1)).bit_count()
+            for col in range(COLS)]
+
+def drop_bit(bb, col, height):
+    """Drop a piece for the bitboard player in the given column.
+    Returns the new bitboard; height is the current piece count of the column.
+    """
+    return bb | (1 << (col * BITS_PER_COL + height))
+
+@njit(cache=True)
+def is_win(bb):
+    """Check if the bitboard contains four in a row.
+    The four shifts cover vertical (1), horizontal (BITS_PER_COL) and the
+    two diagonals (BITS_PER_COL - 1, BITS_PER_COL + 1).
+    """
+    for shift in (1, BITS_PER_COL, BITS_PER_COL - 1, BITS_PER_COL + 1):
+        m = bb & (bb >> shift)
+        if m & (m >> (2 * shift)):
+            return True
+    return False
+
+def valid_move_mask(bb1, bb2):
+    """Mask of the top playable cell of every non-full column"""
+    return ~(bb1 | bb2) & TOP_MASK
+
+def get_valid_moves_bb(bb1, bb2):
+    """Get list of valid column indices from the bitboards"""
+    mask = valid_move_mask(bb1, bb2)
+    moves = []
+    while mask:
+        lsb = mask & -mask
+        moves.append((lsb.bit_length() - 1) // BITS_PER_COL)
+        mask &= mask - 1
+    return moves
+
+def is_full(bb1, bb2):
+    """Check if the board is completely full"""
+    return (bb1 | bb2) & BOARD_MASK == BOARD_MASK
+
+@njit(cache=True)
+def playable_mask(bb1, bb2):
+    """Mask of the lowest empty cell in every non-full column"""
+    return ((bb1 | bb2) + BOTTOM_MASK) & BOARD_MASK
+
+@njit(cache=True)
+def winning_squares(bb):
+    """Mask of squares that would complete four in a row for the bitboard.
+    Uses the standard shift-and threat formula; the caller intersects the
+    result with the empty/playable squares.
+    """
+    h = ROWS
+    h1 = BITS_PER_COL
+    h2 = BITS_PER_COL + 1
+
+    # Vertical
+    r = (bb << 1) & (bb << 2) & (bb << 3)
+
+    # Horizontal, rising diagonal and falling diagonal: for each direction,
+    # find squares with three of our pieces in the window around them
+    for shift in (h1, h, h2):
+        p = (bb << shift) & (bb << (2 * shift))
+        r |= p & (bb << (3 * shift))
+        r |= p & (bb >> shift)
+        p = (bb >> shift) & (bb >> (2 * shift))
+        r |= p & (bb << shift)
+        r |= p & (bb >> (3 * shift))
+
+    return r & BOARD_MASK
+
+def col_of_bit(mask):
+    """Column index of the lowest set bit in the mask"""
+    lsb = mask & -mask
+    return (lsb.bit_length() - 1) // BITS_PER_COL
+
+def find_immediate_move(bb_self, bb_opp):
+    """Find an immediate winning or blocking column, if any.
+    Returns (col, True) for a winning move, (col, False) for a block,
+    or (None, False) when neither exists.
+    """
+    playable = playable_mask(bb_self, bb_opp)
+    threats = winning_squares(bb_self) & playable
+    if threats:
+        return (col_of_bit(threats), True)
+    threats = winning_squares(bb_opp) & playable
+    if threats:
+        return (col_of_bit(threats), False)
+    return (None, False)
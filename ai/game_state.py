@@ -16,6 +16,19 @@ def get_valid_moves(board):
     """Get list of valid column indices (columns that are not full)"""
     return [col for col in range(COLS) if board[0][col] == 0]
 
+def get_valid_moves_with_rows(board):
+    """Get [(col, drop_row), ...] for every non-full column in one pass,
+    so callers don't follow get_valid_moves with per-column get_drop_row
+    """
+    moves = []
+    for col in range(COLS):
+        if board[0][col] == 0:
+            row = ROWS - 1
+            while board[row][col] != 0:
+                row -= 1
+            moves.append((col, row))
+    return moves
+
 def get_drop_row(board, col):
     """Get the row where a piece would land in the given column"""
     for row in range(ROWS - 1, -1, -1):
@@ -36,41 +49,74 @@ def drop_piece(board, col, player):
     new_board[row][col] = player
     return (row, new_board)
 
+def pack_board(board):
+    """Pack the board into flat bytes (row-major, one byte per cell).
+    Copies in a single pass and is hashable, so it doubles as a cheap
+    board key and a compact serialization format.
+    """
+    return bytes(cell for row in board for cell in row)
+
+def unpack_board(packed):
+    """Rebuild a list-of-lists board from pack_board output"""
+    return [list(packed[row * COLS:(row + 1) * COLS]) for row in range(ROWS)]
+
+def get_column_heights(board):
+    """Get the number of pieces in each column as a list of COLS ints"""
+    heights = [0] * COLS
+    for col in range(COLS):
+        for row in range(ROWS):
+            if board[row][col] != 0:
+                heights[col] = ROWS - row
+                break
+    return heights
+
+def make_move(board, col, player, heights):
+    """Place a piece in-place using the heights array. Returns the row used.
+    The caller must undo with undo_move to restore the board.
+    """
+    row = ROWS - 1 - heights[col]
+    board[row][col] = player
+    heights[col] += 1
+    return row
+
+def undo_move(board, col, heights):
+    """Undo the most recent make_move in the given column"""
+    heights[col] -= 1
+    board[ROWS - 1 - heights[col]][col] = 0
+
 def check_win(board, row, col, player):
     """Check if placing a piece at (row, col) results in a win for the player"""
     if row < 0 or row >= ROWS or col < 0 or col >= COLS:
         return False
-    
-    # Check horizontal
+
+    # Check horizontal (bind the row once; tight while loops beat
+    # for/range with break in CPython)
+    board_row = board[row]
     count = 1
-    for c in range(col - 1, -1, -1):
-        if board[row][c] == player:
-            count += 1
-        else:
-            break
-    for c in range(col + 1, COLS):
-        if board[row][c] == player:
-            count += 1
-        else:
-            break
+    c = col - 1
+    while c >= 0 and board_row[c] == player:
+        count += 1
+        c -= 1
+    c = col + 1
+    while c < COLS and board_row[c] == player:
+        count += 1
+        c += 1
     if count >= 4:
         return True
-    
+
     # Check vertical
     count = 1
-    for r in range(row - 1, -1, -1):
-        if board[r][col] == player:
-            count += 1
-        else:
-            break
-    for r in range(row + 1, ROWS):
-        if board[r][col] == player:
-            count += 1
-        else:
-            break
+    r = row - 1
+    while r >= 0 and board[r][col] == player:
+        count += 1
+        r -= 1
+    r = row + 1
+    while r < ROWS and board[r][col] == player:
+        count += 1
+        r += 1
     if count >= 4:
         return True
-    
+
     # Check diagonal (top-left to bottom-right)
     count = 1
     r, c = row - 1, col - 1
@@ -85,7 +131,7 @@ def check_win(board, row, col, player):
         c += 1
     if count >= 4:
         return True
-    
+
     # Check diagonal (top-right to bottom-left)
     count = 1
     r, c = row - 1, col + 1
@@ -100,7 +146,7 @@ def check_win(board, row, col, player):
         c -= 1
     if count >= 4:
         return True
-    
+
     return False
 
 def is_board_full(board):
@@ -2,89 +2,109 @@
 Heuristic evaluation function for Connect Four
 Evaluates non-terminal board states using various features
 """
+import numpy as np
 from .game_state import COLS, ROWS
+from .bitboard import BITS_PER_COL, board_to_bitboards
+
+def _build_line_masks():
+    """Build the 69 possible four-in-a-row line masks in bitboard layout"""
+    masks = []
+    # Horizontal
+    for row in range(ROWS):
+        for col in range(COLS - 3):
+            masks.append(sum(1 << ((col + i) * BITS_PER_COL + row) for i in range(4)))
+    # Vertical
+    for col in range(COLS):
+        for row in range(ROWS - 3):
+            masks.append(sum(1 << (col * BITS_PER_COL + row + i) for i in range(4)))
+    # Diagonal (rising)
+    for col in range(COLS - 3):
+        for row in range(ROWS - 3):
+            masks.append(sum(1 << ((col + i) * BITS_PER_COL + row + i) for i in range(4)))
+    # Diagonal (falling)
+    for col in range(COLS - 3):
+        for row in range(3, ROWS):
+            masks.append(sum(1 << ((col + i) * BITS_PER_COL + row - i) for i in range(4)))
+    return masks
+
+# The 69 winning-line masks, as a vectorized uint64 array
+LINE_MASKS = _build_line_masks()
+_LINES = np.array(LINE_MASKS, dtype=np.uint64)
+
+def _build_score_table():
+    """Score for a line holding (player_count, opponent_count) pieces.
+    Mixed lines are blocked and worth 0; the rest matches the original
+    per-sequence if-chain.
+    """
+    table = np.zeros((5, 5), dtype=np.int64)
+    table[4, 0] = 10000   # Win
+    table[0, 4] = -10000  # Loss
+    table[3, 0] = 1000    # Our threat (can win)
+    table[0, 3] = -1000   # Opponent threat (must block)
+    table[2, 0] = 100     # Our potential
+    table[0, 2] = -100    # Opponent potential
+    table[1, 0] = 10      # Our start
+    table[0, 1] = -10     # Opponent start
+    return table
+
+_SCORE_TABLE = _build_score_table()
+
+# Center column cells in bitboard layout
+_CENTER_MASK = ((1 << ROWS) - 1) << ((COLS // 2) * BITS_PER_COL)
+
+if hasattr(np, 'bitwise_count'):
+    _popcount = np.bitwise_count
+else:
+    # NumPy < 2.0: popcount via a 16-bit lookup table over the four halfwords
+    _POP16 = np.array([bin(i).count('1') for i in range(1 << 16)], dtype=np.uint8)
+    def _popcount(arr):
+        low16 = np.uint64(0xFFFF)
+        return (_POP16[arr & low16].astype(np.int64) +
+                _POP16[(arr >> np.uint64(16)) & low16] +
+                _POP16[(arr >> np.uint64(32)) & low16] +
+                _POP16[(arr >> np.uint64(48)) & low16])
+
+def evaluate_board_bb(bb_player, bb_opponent):
+    """
+    Evaluate a position given the player's and opponent's bitboards.
+    Returns a score where positive values favor the player.
+    """
+    # Center column control (more valuable)
+    center = np.uint64(_CENTER_MASK)
+    p = np.uint64(bb_player)
+    o = np.uint64(bb_opponent)
+    score = 3 * (int(p & center).bit_count() - int(o & center).bit_count())
+
+    # One popcount per line per side, then a single table lookup replaces
+    # the per-sequence branchy scoring
+    player_counts = _popcount(_LINES & p)
+    opponent_counts = _popcount(_LINES & o)
+    score += int(_SCORE_TABLE[player_counts, opponent_counts].sum())
+    return score
 
 def evaluate_board(board, player):
     """
     Evaluate the board state from the perspective of the given player.
     Returns a score where positive values favor the player.
     """
-    opponent = 3 - player  # If player is 1, opponent is 2; if player is 2, opponent is 1
-    score = 0
-    
-    # 1. Center column control (more valuable)
-    center_col = COLS // 2
-    for row in range(ROWS):
-        if board[row][center_col] == player:
-            score += 3
-        elif board[row][center_col] == opponent:
-            score -= 3
-    
-    # 2. Evaluate all possible 4-in-a-row sequences
-    # Horizontal sequences
-    for row in range(ROWS):
-        for col in range(COLS - 3):
-            score += evaluate_sequence(board, row, col, 0, 1, player, opponent)
-    
-    # Vertical sequences
-    for row in range(ROWS - 3):
-        for col in range(COLS):
-            score += evaluate_sequence(board, row, col, 1, 0, player, opponent)
-    
-    # Diagonal (top-left to bottom-right)
-    for row in range(ROWS - 3):
-        for col in range(COLS - 3):
-            score += evaluate_sequence(board, row, col, 1, 1, player, opponent)
-    
-    # Diagonal (top-right to bottom-left)
-    for row in range(ROWS - 3):
-        for col in range(3, COLS):
-            score += evaluate_sequence(board, row, col, 1, -1, player, opponent)
-    
-    return score
+    bb1, bb2 = board_to_bitboards(board)
+    if player == 1:
+        return evaluate_board_bb(bb1, bb2)
+    return evaluate_board_bb(bb2, bb1)
 
 def evaluate_sequence(board, start_row, start_col, delta_row, delta_col, player, opponent):
     """
     Evaluate a sequence of 4 cells in a specific direction.
     Returns a score based on the potential of this sequence.
     """
-    player_count = 0
-    opponent_count = 0
-    empty_count = 0
-    
-    for i in range(4):
-        row = start_row + i * delta_row
-        col = start_col + i * delta_col
-        cell = board[row][col]
-        
-        if cell == player:
-            player_count += 1
-        elif cell == opponent:
-            opponent_count += 1
-        else:
-            empty_count += 1
-    
-    # If both players have pieces, this sequence is blocked
-    if opponent_count > 0 and player_count > 0:
-        return 0
-    
-    # Score based on potential
-    if player_count == 4:
-        return 10000  # Win
-    if opponent_count == 4:
-        return -10000  # Loss
-    if opponent_count == 3 and empty_count == 1:
-        return -1000  # Opponent threat (must block)
-    if player_count == 3 and empty_count == 1:
-        return 1000  # Our threat (can win)
-    if opponent_count == 2 and empty_count == 2:
-        return -100  # Opponent potential
-    if player_count == 2 and empty_count == 2:
-        return 100  # Our potential
-    if player_count == 1 and empty_count == 3:
-        return 10  # Our start
-    if opponent_count == 1 and empty_count == 3:
-        return -10  # Opponent start
-    
-    return 0
+    # Unrolled: the four cells are read directly, skipping the loop and
+    # per-step row/col arithmetic
+    c0 = board[start_row][start_col]
+    c1 = board[start_row + delta_row][start_col + delta_col]
+    c2 = board[start_row + 2 * delta_row][start_col + 2 * delta_col]
+    c3 = board[start_row + 3 * delta_row][start_col + 3 * delta_col]
+
+    player_count = (c0 == player) + (c1 == player) + (c2 == player) + (c3 == player)
+    opponent_count = (c0 == opponent) + (c1 == opponent) + (c2 == opponent) + (c3 == opponent)
 
+    return int(_SCORE_TABLE[player_count][opponent_count])
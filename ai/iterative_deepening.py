@@ -2,8 +2,12 @@
 Iterative deepening implementation for Connect Four AI
 """
 import time
-from .minimax import minimax_with_ab, MinimaxStats
+from .minimax import minimax_with_ab, MinimaxStats, SearchTimeout, clear_killers
 from .game_state import get_valid_moves, get_drop_row, copy_board, check_win
+from .bitboard import board_to_bitboards, find_immediate_move
+
+# Half-width of the aspiration window around the previous depth's score
+ASPIRATION_DELTA = 50
 
 def iterative_deepening(board, max_depth, player, time_limit=5.0, randomness=0.0):
     """
@@ -23,36 +27,57 @@ def iterative_deepening(board, max_depth, player, time_limit=5.0, randomness=0.0
     if not valid_moves:
         return (None, 0, stats)
     
-    # Check for immediate win
-    for col in valid_moves:
-        row = get_drop_row(board, col)
-        if row == -1:
-            continue
-        new_board = copy_board(board)
-        new_board[row][col] = player
-        if check_win(new_board, row, col, player):
-            return (col, 0, stats)
-    
-    # Check for opponent's immediate win (must block)
-    opponent = 3 - player
-    for col in valid_moves:
-        row = get_drop_row(board, col)
-        if row == -1:
-            continue
-        new_board = copy_board(board)
-        new_board[row][col] = opponent
-        if check_win(new_board, row, col, opponent):
-            return (col, 0, stats)
-    
-    # Iterative deepening
+    # Check for an immediate win or forced block with the bitboard threat
+    # mask instead of probing every column with board copies
+    bb1, bb2 = board_to_bitboards(board)
+    bb_self, bb_opp = (bb1, bb2) if player == 1 else (bb2, bb1)
+    col, _ = find_immediate_move(bb_self, bb_opp)
+    if col is not None:
+        return (col, 0, stats)
+
+    # Iterative deepening: feed each depth's best move back in as the
+    # first move searched at the next depth, and stop at the deadline
+    deadline = time.monotonic() + time_limit
+    pv_move = None
+    prev_value = None
     for depth in range(1, max_depth + 1):
         if time.time() - start_time > time_limit:
             break
-        
+
         stats.reset()
-        _, best_move = minimax_with_ab(
-            board, depth, float('-inf'), float('inf'), True, player, stats, randomness
-        )
+        clear_killers()
+        # Search into temporaries and only commit them below once a
+        # trusted (in-window or full-window) search finishes: an
+        # out-of-window result, especially a fail-low, proves nothing
+        # about its move and must not replace the last depth's best
+        try:
+            if prev_value is not None:
+                # Aspiration window: search a narrow window around the
+                # previous depth's score first, and fall back to a full
+                # window only when the score lands outside it
+                alpha = prev_value - ASPIRATION_DELTA
+                beta = prev_value + ASPIRATION_DELTA
+                value, move = minimax_with_ab(
+                    board, depth, alpha, beta, True, player, stats, randomness,
+                    pv_move=pv_move, deadline=deadline
+                )
+                if value <= alpha or value >= beta:
+                    value, move = minimax_with_ab(
+                        board, depth, float('-inf'), float('inf'), True, player, stats, randomness,
+                        pv_move=pv_move, deadline=deadline
+                    )
+            else:
+                value, move = minimax_with_ab(
+                    board, depth, float('-inf'), float('inf'), True, player, stats, randomness,
+                    pv_move=pv_move, deadline=deadline
+                )
+        except SearchTimeout:
+            # Deadline hit mid-search: keep the best move from the last
+            # completed depth
+            break
+        prev_value = value
+        best_move = move
+        pv_move = move
         final_depth = depth
         
         # If we found a winning move, return immediately
@@ -4,11 +4,94 @@ Minimax algorithm implementations:
 2. Minimax with alpha-beta pruning
 """
 import random
-from .game_state import get_valid_moves, get_drop_row, copy_board, check_win, is_terminal, COLS
+import time
+from .game_state import get_valid_moves, check_win, is_terminal, is_board_full, get_column_heights, make_move, undo_move, COLS, ROWS
 from .heuristic import evaluate_board
 
+# Zobrist hashing keys: one 64-bit key per (player, row, col)
+ZOBRIST = [[[random.getrandbits(64) for _ in range(COLS)]
+            for _ in range(ROWS)]
+           for _ in range(2)]
+
+# Per-root-player salts folded into the search hash: stored values are
+# scored from the searching player's perspective, so the same position
+# searched by each side must land on distinct table entries
+ZOBRIST_PLAYER = [random.getrandbits(64), random.getrandbits(64)]
+
+# Transposition table entry flags
+TT_EXACT = 0
+TT_LOWER = 1  # value is a lower bound (search failed high)
+TT_UPPER = 2  # value is an upper bound (search failed low)
+
+# Shared transposition table: hash -> (depth, value, flag, best_move).
+# Kept warm across iterative-deepening depths and across server requests;
+# cleared between games.
+_TT = {}
+
+# Stop growing the table past this many entries (~64 bytes/entry)
+_TT_MAX_ENTRIES = 1 << 20
+
+def compute_hash(board):
+    """Compute the Zobrist hash of a full board"""
+    h = 0
+    for row in range(ROWS):
+        for col in range(COLS):
+            piece = board[row][col]
+            if piece != 0:
+                h ^= ZOBRIST[piece - 1][row][col]
+    return h
+
+def zobrist_update(h, player, row, col):
+    """Incrementally update a hash for a piece placed/removed at (row, col)"""
+    return h ^ ZOBRIST[player - 1][row][col]
+
+def clear_tt():
+    """Clear the transposition table (call between games)"""
+    _TT.clear()
+
+# Deepest search the killer table supports (a full board is 42 plies)
+MAX_DEPTH = ROWS * COLS
+
+# Killer moves: per remaining depth, the two columns that most recently
+# caused a beta cutoff. Cheap complement to TT/PV ordering.
+_KILLERS = [[-1, -1] for _ in range(MAX_DEPTH + 1)]
+
+def clear_killers():
+    """Reset the killer-move table (call before each search depth)"""
+    for slots in _KILLERS:
+        slots[0] = -1
+        slots[1] = -1
+
+def _record_killer(depth, col):
+    """Shift-insert a cutoff move into the killer slots for this depth"""
+    slots = _KILLERS[depth]
+    if slots[0] != col:
+        slots[1] = slots[0]
+        slots[0] = col
+
+class SearchTimeout(Exception):
+    """Raised inside the search when the deadline passes"""
+    pass
+
+# How often (in expanded nodes) the search checks its deadline
+_DEADLINE_CHECK_INTERVAL = 4096
+
+# Hoisted so hot code avoids a builtin lookup + call per node
+NEG_INF = float('-inf')
+POS_INF = float('inf')
+
+# Dedicated RNG instance: skips the random-module attribute indirection on
+# every call and allows deterministic reproduction via set_seed
+_rng = random.Random()
+
+def set_seed(seed):
+    """Seed the search RNG for reproducible move selection"""
+    _rng.seed(seed)
+
 class MinimaxStats:
     """Track statistics for minimax search"""
+    __slots__ = ('nodes_expanded', 'pruned_nodes')
+
     def __init__(self):
         self.nodes_expanded = 0
         self.pruned_nodes = 0
@@ -17,7 +100,7 @@ class MinimaxStats:
         self.nodes_expanded = 0
         self.pruned_nodes = 0
 
-def minimax_without_ab(board, depth, maximizing_player, player, stats=None, randomness=0.0):
+def minimax_without_ab(board, depth, maximizing_player, player, stats=None, randomness=0.0, heights=None, is_root=True, last_move=None):
     """
     Minimax algorithm without alpha-beta pruning.
     Returns (best_value, best_move)
@@ -25,27 +108,48 @@ def minimax_without_ab(board, depth, maximizing_player, player, stats=None, rand
     Args:
         randomness: Probability (0.0-1.0) of making a random move instead of best move
                     Higher values make AI weaker and more beatable
+        heights: Per-column piece counts (None = compute from board); the
+                 board is mutated in place and restored via make/undo
+        is_root: True only for the top-level call; shuffling and the
+                 randomness mistake logic apply at the root only
+        last_move: (row, col, player) of the move that produced this
+                   board; a win can only run through that square, so the
+                   terminal test checks it instead of rescanning the board
     """
     if stats is None:
         stats = MinimaxStats()
-    
+    if heights is None:
+        heights = get_column_heights(board)
+    opponent = 3 - player
+
     stats.nodes_expanded += 1
-    
-    # Check for terminal states
-    is_term, winner = is_terminal(board)
-    if is_term:
-        if winner == player:
-            return (10000 - depth, None)  # Win for maximizing player
-        elif winner == 3 - player:
+
+    # Check for terminal states: when the last move is known, only that
+    # square can have completed a win; the full board scan is kept for
+    # arbitrary entry positions
+    if last_move is not None:
+        last_row, last_col, last_player = last_move
+        if check_win(board, last_row, last_col, last_player):
+            if last_player == player:
+                return (10000 - depth, None)  # Win for maximizing player
             return (-10000 + depth, None)  # Loss for maximizing player
-        else:
+        if is_board_full(board):
             return (0, None)  # Draw
+    else:
+        is_term, winner = is_terminal(board)
+        if is_term:
+            if winner == player:
+                return (10000 - depth, None)  # Win for maximizing player
+            elif winner == opponent:
+                return (-10000 + depth, None)  # Loss for maximizing player
+            else:
+                return (0, None)  # Draw
     
     if depth == 0:
         eval_score = evaluate_board(board, player)
         # Add small random noise for lower depths to allow draws
         if randomness > 0:
-            noise = random.uniform(-randomness * 50, randomness * 50)
+            noise = _rng.uniform(-randomness * 50, randomness * 50)
             eval_score += noise
         return (eval_score, None)
     
@@ -53,198 +157,361 @@ def minimax_without_ab(board, depth, maximizing_player, player, stats=None, rand
     if not valid_moves:
         return (0, None)  # Draw
     
-    # Order moves (center columns first), then shuffle to break ties
+    # Order moves (center columns first); only the root shuffles to break
+    # ties — shuffling inside the recursion destroys the center-first
+    # ordering that alpha-beta pruning depends on
     ordered_moves = order_moves(valid_moves)
-    random.shuffle(ordered_moves)  # Shuffle to break deterministic patterns
+    if is_root:
+        _rng.shuffle(ordered_moves)
     
     if maximizing_player:
-        max_eval = float('-inf')
+        max_eval = NEG_INF
         best_moves = []  # Store all moves with best evaluation
         
         for col in ordered_moves:
-            row = get_drop_row(board, col)
-            if row == -1:
+            if heights[col] >= ROWS:
                 continue
-            
-            new_board = copy_board(board)
-            new_board[row][col] = player
-            
+            row = make_move(board, col, player, heights)
+
             # Check for immediate win
-            if check_win(new_board, row, col, player):
+            if check_win(board, row, col, player):
+                undo_move(board, col, heights)
                 return (10000 - depth, col)
-            
-            eval_score, _ = minimax_without_ab(new_board, depth - 1, False, player, stats, randomness)
-            
+
+            eval_score, _ = minimax_without_ab(board, depth - 1, False, player, stats, randomness, heights, is_root=False, last_move=(row, col, player))
+            undo_move(board, col, heights)
+
             if eval_score > max_eval:
                 max_eval = eval_score
                 best_moves = [col]  # Reset best moves list
             elif eval_score == max_eval:
                 best_moves.append(col)  # Add to equally good moves
         
-        # Randomly select from equally good moves, or make random mistake
-        if randomness > 0 and random.random() < randomness:
-            best_move = random.choice(ordered_moves)
-        elif best_moves:
-            best_move = random.choice(best_moves)  # Randomize among best moves
-        else:
+        # At the root: randomly select from equally good moves, or make a
+        # random mistake. Inner nodes pick deterministically.
+        if is_root and randomness > 0 and _rng.random() < randomness:
+            best_move = _rng.choice(ordered_moves)
+        elif not best_moves:
             best_move = ordered_moves[0]
+        elif is_root:
+            best_move = _rng.choice(best_moves)  # Randomize among best moves
+        else:
+            best_move = best_moves[0]
         
         return (max_eval, best_move)
     else:
-        min_eval = float('inf')
+        min_eval = POS_INF
         best_moves = []  # Store all moves with best evaluation
-        
-        opponent = 3 - player
+
         for col in ordered_moves:
-            row = get_drop_row(board, col)
-            if row == -1:
+            if heights[col] >= ROWS:
                 continue
-            
-            new_board = copy_board(board)
-            new_board[row][col] = opponent
-            
+            row = make_move(board, col, opponent, heights)
+
             # Check for immediate win
-            if check_win(new_board, row, col, opponent):
+            if check_win(board, row, col, opponent):
+                undo_move(board, col, heights)
                 return (-10000 + depth, col)
-            
-            eval_score, _ = minimax_without_ab(new_board, depth - 1, True, player, stats, randomness)
-            
+
+            eval_score, _ = minimax_without_ab(board, depth - 1, True, player, stats, randomness, heights, is_root=False, last_move=(row, col, opponent))
+            undo_move(board, col, heights)
+
             if eval_score < min_eval:
                 min_eval = eval_score
                 best_moves = [col]  # Reset best moves list
             elif eval_score == min_eval:
                 best_moves.append(col)  # Add to equally good moves
         
-        # Randomly select from equally good moves, or make random mistake
-        if randomness > 0 and random.random() < randomness:
-            best_move = random.choice(ordered_moves)
-        elif best_moves:
-            best_move = random.choice(best_moves)  # Randomize among best moves
-        else:
+        # At the root: randomly select from equally good moves, or make a
+        # random mistake. Inner nodes pick deterministically.
+        if is_root and randomness > 0 and _rng.random() < randomness:
+            best_move = _rng.choice(ordered_moves)
+        elif not best_moves:
             best_move = ordered_moves[0]
+        elif is_root:
+            best_move = _rng.choice(best_moves)  # Randomize among best moves
+        else:
+            best_move = best_moves[0]
         
         return (min_eval, best_move)
 
-def minimax_with_ab(board, depth, alpha, beta, maximizing_player, player, stats=None, randomness=0.0):
+def _leaf_eval(board, player, randomness, stats):
+    """Evaluate a depth-0 frontier node without a full recursive call.
+    The caller has already ruled out a win by the last move, so only the
+    draw check and the static evaluation remain.
     """
-    Minimax algorithm with alpha-beta pruning.
+    stats.nodes_expanded += 1
+    if is_board_full(board):
+        return 0
+    eval_score = evaluate_board(board, player)
+    if randomness > 0:
+        eval_score += _rng.uniform(-randomness * 50, randomness * 50)
+    return eval_score
+
+def minimax_with_ab(board, depth, alpha, beta, maximizing_player, player, stats=None, randomness=0.0, tt=None, board_hash=None, pv_move=None, deadline=None, heights=None, is_root=True, last_move=None):
+    """
+    Minimax algorithm with alpha-beta pruning and a Zobrist-keyed
+    transposition table.
     Returns (best_value, best_move)
-    
+
     Args:
         randomness: Probability (0.0-1.0) of making a random move instead of best move
                     Higher values make AI weaker and more beatable
+        tt: Transposition table dict (None = shared module-level table)
+        board_hash: Zobrist hash of the board including the root player
+                    salt (None = compute from scratch)
+        pv_move: Move to search first (the previous iteration's best at the root)
+        deadline: time.monotonic() timestamp; raises SearchTimeout when passed
+        heights: Per-column piece counts (None = compute from board); the
+                 board is mutated in place and restored via make/undo
+        is_root: True only for the top-level call; shuffling and the
+                 randomness mistake logic apply at the root only
+        last_move: (row, col, player) of the move that produced this
+                   board; a win can only run through that square, so the
+                   terminal test checks it instead of rescanning the board
     """
     if stats is None:
         stats = MinimaxStats()
-    
+    if tt is None:
+        tt = _TT
+    if board_hash is None:
+        # Child hashes derive from this root hash via zobrist_update, so
+        # the player salt propagates through the whole subtree
+        board_hash = compute_hash(board) ^ ZOBRIST_PLAYER[player - 1]
+    if heights is None:
+        heights = get_column_heights(board)
+    opponent = 3 - player
+
     stats.nodes_expanded += 1
-    
-    # Check for terminal states
-    is_term, winner = is_terminal(board)
-    if is_term:
-        if winner == player:
-            return (10000 - depth, None)  # Win for maximizing player
-        elif winner == 3 - player:
+    if deadline is not None and stats.nodes_expanded % _DEADLINE_CHECK_INTERVAL == 0:
+        if time.monotonic() > deadline:
+            raise SearchTimeout()
+
+    # Check for terminal states: when the last move is known, only that
+    # square can have completed a win; the full board scan is kept for
+    # arbitrary entry positions
+    if last_move is not None:
+        last_row, last_col, last_player = last_move
+        if check_win(board, last_row, last_col, last_player):
+            if last_player == player:
+                return (10000 - depth, None)  # Win for maximizing player
             return (-10000 + depth, None)  # Loss for maximizing player
-        else:
+        if is_board_full(board):
             return (0, None)  # Draw
-    
+    else:
+        is_term, winner = is_terminal(board)
+        if is_term:
+            if winner == player:
+                return (10000 - depth, None)  # Win for maximizing player
+            elif winner == opponent:
+                return (-10000 + depth, None)  # Loss for maximizing player
+            else:
+                return (0, None)  # Draw
+
     if depth == 0:
         eval_score = evaluate_board(board, player)
         # Add small random noise for lower depths to allow draws
         if randomness > 0:
-            noise = random.uniform(-randomness * 50, randomness * 50)
+            noise = _rng.uniform(-randomness * 50, randomness * 50)
             eval_score += noise
         return (eval_score, None)
-    
+
+    # Probe the transposition table: reuse the stored value when it was
+    # searched at least this deep, otherwise try its best move first
+    alpha_orig = alpha
+    beta_orig = beta
+    tt_move = None
+    entry = tt.get(board_hash)
+    if entry is not None:
+        entry_depth, entry_value, entry_flag, entry_move = entry
+        tt_move = entry_move
+        if entry_depth >= depth:
+            if entry_flag == TT_EXACT:
+                return (entry_value, entry_move)
+            elif entry_flag == TT_LOWER:
+                alpha = max(alpha, entry_value)
+            elif entry_flag == TT_UPPER:
+                beta = min(beta, entry_value)
+            if beta <= alpha:
+                return (entry_value, entry_move)
+
     valid_moves = get_valid_moves(board)
     if not valid_moves:
         return (0, None)  # Draw
-    
-    # Order moves (center columns first), then shuffle to break ties
+
+    # Order moves (center columns first); only the root shuffles to break
+    # ties — shuffling inside the recursion destroys the center-first
+    # ordering that alpha-beta pruning depends on
     ordered_moves = order_moves(valid_moves)
-    random.shuffle(ordered_moves)  # Shuffle to break deterministic patterns
-    
+    if is_root:
+        _rng.shuffle(ordered_moves)
+
+    # Killer moves from this depth go ahead of the center-first default
+    # but behind the TT and PV moves promoted below
+    killers = _KILLERS[depth]
+    for killer in (killers[1], killers[0]):
+        if killer in ordered_moves:
+            ordered_moves.remove(killer)
+            ordered_moves.insert(0, killer)
+
+    # Search the stored best move first to amplify pruning
+    if tt_move is not None and tt_move in ordered_moves:
+        ordered_moves.remove(tt_move)
+        ordered_moves.insert(0, tt_move)
+
+    # The previous iteration's PV move outranks even the TT move
+    if pv_move is not None and pv_move in ordered_moves:
+        ordered_moves.remove(pv_move)
+        ordered_moves.insert(0, pv_move)
+
     if maximizing_player:
-        max_eval = float('-inf')
+        max_eval = NEG_INF
         best_moves = []  # Store all moves with best evaluation
-        
-        for col in ordered_moves:
-            row = get_drop_row(board, col)
-            if row == -1:
+        num_moves = len(ordered_moves)
+
+        for i, col in enumerate(ordered_moves):
+            if heights[col] >= ROWS:
                 continue
-            
-            new_board = copy_board(board)
-            new_board[row][col] = player
-            
+            row = make_move(board, col, player, heights)
+            child_hash = zobrist_update(board_hash, player, row, col)
+
             # Check for immediate win
-            if check_win(new_board, row, col, player):
+            if check_win(board, row, col, player):
+                undo_move(board, col, heights)
+                tt[board_hash] = (depth, 10000 - depth, TT_EXACT, col)
                 return (10000 - depth, col)
-            
-            eval_score, _ = minimax_with_ab(new_board, depth - 1, alpha, beta, False, player, stats, randomness)
-            
+
+            # Specialize the last ply: children of depth-1 nodes are
+            # leaves, so evaluate them in place instead of paying for a
+            # recursive call that only reaches the depth-0 case
+            if depth == 1:
+                eval_score = _leaf_eval(board, player, randomness, stats)
+                undo_move(board, col, heights)
+            else:
+                try:
+                    eval_score, _ = minimax_with_ab(board, depth - 1, alpha, beta, False, player, stats, randomness, tt, child_hash, deadline=deadline, heights=heights, is_root=False, last_move=(row, col, player))
+                finally:
+                    undo_move(board, col, heights)
+
             if eval_score > max_eval:
                 max_eval = eval_score
                 best_moves = [col]  # Reset best moves list
             elif eval_score == max_eval:
                 best_moves.append(col)  # Add to equally good moves
-            
+
             alpha = max(alpha, eval_score)
             if beta <= alpha:
-                stats.pruned_nodes += len(ordered_moves) - ordered_moves.index(col) - 1
+                stats.pruned_nodes += num_moves - i - 1
+                _record_killer(depth, col)
                 break  # Alpha-beta pruning
-        
-        # Randomly select from equally good moves, or make random mistake
-        if randomness > 0 and random.random() < randomness:
-            best_move = random.choice(ordered_moves)
-        elif best_moves:
-            best_move = random.choice(best_moves)  # Randomize among best moves
-        else:
+
+        _store_tt(tt, board_hash, depth, max_eval, alpha_orig, beta_orig,
+                  best_moves[0] if best_moves else None)
+
+        # At the root: randomly select from equally good moves, or make a
+        # random mistake. Inner nodes pick deterministically.
+        if is_root and randomness > 0 and _rng.random() < randomness:
+            best_move = _rng.choice(ordered_moves)
+        elif not best_moves:
             best_move = ordered_moves[0]
-        
+        elif is_root:
+            best_move = _rng.choice(best_moves)  # Randomize among best moves
+        else:
+            best_move = best_moves[0]
+
         return (max_eval, best_move)
     else:
-        min_eval = float('inf')
+        min_eval = POS_INF
         best_moves = []  # Store all moves with best evaluation
-        
-        opponent = 3 - player
-        for col in ordered_moves:
-            row = get_drop_row(board, col)
-            if row == -1:
+        num_moves = len(ordered_moves)
+
+        for i, col in enumerate(ordered_moves):
+            if heights[col] >= ROWS:
                 continue
-            
-            new_board = copy_board(board)
-            new_board[row][col] = opponent
-            
+            row = make_move(board, col, opponent, heights)
+            child_hash = zobrist_update(board_hash, opponent, row, col)
+
             # Check for immediate win
-            if check_win(new_board, row, col, opponent):
+            if check_win(board, row, col, opponent):
+                undo_move(board, col, heights)
+                tt[board_hash] = (depth, -10000 + depth, TT_EXACT, col)
                 return (-10000 + depth, col)
-            
-            eval_score, _ = minimax_with_ab(new_board, depth - 1, alpha, beta, True, player, stats, randomness)
-            
+
+            # Same last-ply specialization as the maximizing branch
+            if depth == 1:
+                eval_score = _leaf_eval(board, player, randomness, stats)
+                undo_move(board, col, heights)
+            else:
+                try:
+                    eval_score, _ = minimax_with_ab(board, depth - 1, alpha, beta, True, player, stats, randomness, tt, child_hash, deadline=deadline, heights=heights, is_root=False, last_move=(row, col, opponent))
+                finally:
+                    undo_move(board, col, heights)
+
             if eval_score < min_eval:
                 min_eval = eval_score
                 best_moves = [col]  # Reset best moves list
             elif eval_score == min_eval:
                 best_moves.append(col)  # Add to equally good moves
-            
+
             beta = min(beta, eval_score)
             if beta <= alpha:
-                stats.pruned_nodes += len(ordered_moves) - ordered_moves.index(col) - 1
+                stats.pruned_nodes += num_moves - i - 1
+                _record_killer(depth, col)
                 break  # Alpha-beta pruning
-        
-        # Randomly select from equally good moves, or make random mistake
-        if randomness > 0 and random.random() < randomness:
-            best_move = random.choice(ordered_moves)
-        elif best_moves:
-            best_move = random.choice(best_moves)  # Randomize among best moves
-        else:
+
+        _store_tt(tt, board_hash, depth, min_eval, alpha_orig, beta_orig,
+                  best_moves[0] if best_moves else None)
+
+        # At the root: randomly select from equally good moves, or make a
+        # random mistake. Inner nodes pick deterministically.
+        if is_root and randomness > 0 and _rng.random() < randomness:
+            best_move = _rng.choice(ordered_moves)
+        elif not best_moves:
             best_move = ordered_moves[0]
-        
+        elif is_root:
+            best_move = _rng.choice(best_moves)  # Randomize among best moves
+        else:
+            best_move = best_moves[0]
+
         return (min_eval, best_move)
 
+def _store_tt(tt, board_hash, depth, value, alpha_orig, beta_orig, best_move):
+    """Store a search result with the flag implied by the original window.
+    Keeps deeper entries over shallower ones and stops inserting new keys
+    once the table hits its size cap.
+    """
+    existing = tt.get(board_hash)
+    if existing is not None:
+        if existing[0] > depth:
+            return
+    elif len(tt) >= _TT_MAX_ENTRIES:
+        return
+    if value <= alpha_orig:
+        flag = TT_UPPER
+    elif value >= beta_orig:
+        flag = TT_LOWER
+    else:
+        flag = TT_EXACT
+    tt[board_hash] = (depth, value, flag, best_move)
+
+def _build_order_table():
+    """Precompute center-first orderings for every subset of columns.
+    order_moves is called at every non-leaf node but only has 2**COLS
+    distinct inputs, so a table lookup replaces sorted() with a lambda.
+    """
+    center = COLS // 2
+    table = []
+    for mask in range(1 << COLS):
+        moves = [col for col in range(COLS) if mask & (1 << col)]
+        table.append(tuple(sorted(moves, key=lambda x: abs(x - center))))
+    return table
+
+_ORDER_TABLE = _build_order_table()
+
 def order_moves(moves):
     """Order moves by prioritizing center columns"""
-    center = COLS // 2
-    return sorted(moves, key=lambda x: abs(x - center))
+    mask = 0
+    for col in moves:
+        mask |= 1 << col
+    return list(_ORDER_TABLE[mask])
 
@@ -2,7 +2,7 @@
 Flask API server for Connect Four AI
 """
 from flask import Flask, request, jsonify, send_from_directory
-from flask_cors import CORS
+import json
 import os
 import time
 import random
@@ -11,16 +11,48 @@ from ai import (
     minimax_with_ab,
     iterative_deepening,
     MinimaxStats,
-    get_valid_moves,
-    get_drop_row,
-    copy_board,
-    check_win,
-    is_terminal
+    pack_board,
+    unpack_board
 )
-from ai.game_state import COLS
+from ai.game_state import COLS, ROWS, create_empty_board, get_valid_moves_with_rows, check_win
+from ai.bitboard import board_to_bitboards, find_immediate_move
+from ai.minimax import clear_tt, set_seed
 
 app = Flask(__name__, static_folder='web')
-CORS(app)  # Enable CORS for JavaScript frontend
+
+# Static CORS headers for the JavaScript frontend. The policy is
+# "allow everything for the local UI", so fixed headers stamped in
+# after_request replace the flask_cors per-request inspection stack.
+# Flask's automatic OPTIONS responses pass through here too, which
+# covers preflight requests.
+@app.after_request
+def _add_cors_headers(response):
+    response.headers['Access-Control-Allow-Origin'] = '*'
+    response.headers['Access-Control-Allow-Headers'] = 'Content-Type'
+    response.headers['Access-Control-Allow-Methods'] = 'GET, POST, OPTIONS'
+    return response
+
+# Serialize responses with orjson when available: C-speed encoding for
+# every jsonify (move responses carry numeric stats on each ply).
+# Falls back to the stdlib json module otherwise.
+try:
+    import orjson
+    from flask.json.provider import JSONProvider
+
+    class _OrjsonProvider(JSONProvider):
+        def dumps(self, obj, **kwargs):
+            return orjson.dumps(obj).decode()
+
+        def loads(self, s, **kwargs):
+            return orjson.loads(s)
+
+    app.json = _OrjsonProvider(app)
+
+    def _dumps_bytes(obj):
+        return orjson.dumps(obj)
+except ImportError:
+    def _dumps_bytes(obj):
+        return json.dumps(obj).encode()
 
 @app.route('/')
 def index():
@@ -44,59 +76,167 @@ metrics = {
     'ai_vs_ai_player1_wins': 0,
     'ai_vs_ai_player2_wins': 0,
     'ai_vs_ai_draws': 0,
-    # Performance metrics (combined)
-    'total_nodes_expanded': 0,
-    'total_pruned_nodes': 0,
-    'total_decision_time': 0,
-    'move_count': 0
 }
 
+# Per-move performance metrics (combined): running means updated
+# incrementally on each move, so /api/metrics never divides totals
+_move_count = 0
+_avg_nodes_expanded = 0.0
+_avg_pruned_nodes = 0.0
+_avg_decision_time = 0.0
+
+# Serialized /api/metrics payload; None marks it stale so a polling UI
+# is served cached bytes until something actually changes
+_metrics_json = None
+
+# Static-optimal column ordering for Connect Four: center out. Keeps
+# every fallback/tie-break choice at the app boundary center-biased.
+CENTER_FIRST = (3, 2, 4, 1, 5, 0, 6)
+
+# Randomness by search depth (lower depth = more randomness/mistakes,
+# capped at 20%), precomputed instead of recalculated per branch
+RANDOMNESS_BY_DEPTH = tuple(min(0.2, max(0.0, 0.25 - d * 0.03)) for d in range(32))
+
+NEG_INF = float('-inf')
+POS_INF = float('inf')
+
+# Dedicated RNG instance: skips the random-module indirection per call
+_RNG = random.Random()
+
+def _canonical_key(board):
+    """Packed-bytes board key that maps mirror-symmetric positions to
+    the same entry (the lexicographically smaller of board and mirror)
+    """
+    packed = pack_board(board)
+    mirrored = pack_board([row[::-1] for row in board])
+    return packed if packed <= mirrored else mirrored
+
+def _build_opening_book():
+    """Known best moves for the most frequently hit positions.
+    Center (column 3) is the optimal first move and the strongest reply
+    to any first move, so the empty board and every one-stone position
+    short-circuit to it without searching.
+    """
+    book = {}
+    board = create_empty_board()
+    book[_canonical_key(board)] = 3
+    for col in range(COLS):
+        for first_player in (1, 2):
+            board = create_empty_board()
+            board[ROWS - 1][col] = first_player
+            book[_canonical_key(board)] = 3
+    return book
+
+OPENING_BOOK = _build_opening_book()
+
+# Per-algorithm runners with one shared signature, dispatched through a
+# dict instead of a string elif chain in every request. Each returns
+# (value, best_move, final_depth) and fills in the passed stats.
+def _run_random(board, depth, player, time_limit, stats):
+    """Pick a random valid column (no search)"""
+    valid_moves = [col for col in CENTER_FIRST if board[0][col] == 0]
+    stats.nodes_expanded = 1
+    return (0, _RNG.choice(valid_moves), depth)
+
+def _run_minimax(board, depth, player, time_limit, stats):
+    """Plain minimax at fixed depth"""
+    randomness = RANDOMNESS_BY_DEPTH[depth] if 0 <= depth < 32 else 0.0
+    value, best_move = minimax_without_ab(board, depth, True, player, stats, randomness)
+    return (value, best_move, depth)
+
+def _run_ab(board, depth, player, time_limit, stats):
+    """Alpha-beta minimax at fixed depth"""
+    randomness = RANDOMNESS_BY_DEPTH[depth] if 0 <= depth < 32 else 0.0
+    value, best_move = minimax_with_ab(
+        board, depth, NEG_INF, POS_INF, True, player, stats, randomness
+    )
+    return (value, best_move, depth)
+
+def _run_iterative(board, depth, player, time_limit, stats):
+    """Iterative deepening up to max depth within the time limit"""
+    randomness = RANDOMNESS_BY_DEPTH[depth] if 0 <= depth < 32 else 0.0
+    best_move, final_depth, id_stats = iterative_deepening(
+        board, depth, player, time_limit, randomness
+    )
+    stats.nodes_expanded = id_stats.nodes_expanded
+    stats.pruned_nodes = id_stats.pruned_nodes
+    return (0, best_move, final_depth)  # iterative doesn't report a value
+
+ALGO_DISPATCH = {
+    'minimax': _run_minimax,
+    'minimax_ab': _run_ab,
+    'iterative': _run_iterative,
+    'random': _run_random
+}
+
+# Valid algorithm names, derived from the dispatch table
+VALID_ALGORITHMS = frozenset(ALGO_DISPATCH)
+
+def _search_worker(packed, player, algorithm, depth, time_limit):
+    """Run one search in a worker process.
+    The board travels as 42 packed bytes; each worker process keeps its
+    own module-level transposition table, warmed across its moves.
+    """
+    board = unpack_board(packed)
+    stats = MinimaxStats()
+    value, best_move, final_depth = ALGO_DISPATCH[algorithm](
+        board, depth, player, time_limit, stats
+    )
+    return (value, best_move, final_depth, stats.nodes_expanded, stats.pruned_nodes)
+
+# Optional process pool for the searches: frees the request thread and
+# uses all cores for concurrent games, at the cost of per-worker
+# transposition tables. Opt in with CONNECT4_SEARCH_PROCESSES=<workers>.
+def _seed_worker():
+    """Give each search worker process an independently seeded RNG"""
+    set_seed(int.from_bytes(os.urandom(8), 'little'))
+
+_EXECUTOR = None
+_n_workers = os.environ.get('CONNECT4_SEARCH_PROCESSES')
+if _n_workers:
+    from concurrent.futures import ProcessPoolExecutor
+    _EXECUTOR = ProcessPoolExecutor(max_workers=int(_n_workers) or os.cpu_count(),
+                                    initializer=_seed_worker)
+
 @app.route('/api/move', methods=['POST'])
 def get_move():
     """Get the best move from the AI"""
-    data = request.json
+    data = request.get_json(cache=False, silent=True)
+    if data is None:
+        return jsonify({'error': 'Request body must be JSON'}), 400
     board = data.get('board')
     player = data.get('player', 2)  # AI is player 2 by default
     algorithm = data.get('algorithm', 'minimax_ab')  # 'minimax', 'minimax_ab', 'iterative', 'random'
     depth = data.get('depth', 5)
     time_limit = data.get('time_limit', 5.0)
-    
-    # Convert depth to int if it's a string
-    if isinstance(depth, str):
-        try:
-            depth = int(depth)
-        except ValueError:
-            return jsonify({'error': f'Invalid depth: {depth}'}), 400
-    
+
+    # Coerce depth: one try covers int, float and numeric-string inputs
+    try:
+        depth = int(depth)
+    except (TypeError, ValueError):
+        return jsonify({'error': f'Invalid depth: {depth}'}), 400
+
     # Normalize algorithm string (strip whitespace, convert to lowercase)
     if algorithm:
         algorithm = str(algorithm).strip().lower()
     else:
         algorithm = 'minimax_ab'
-    
-    # Debug logging
-    print(f"DEBUG: Received algorithm: '{algorithm}' (type: {type(algorithm)})")
-    print(f"DEBUG: Full request data: {data}")
-    
-    # Validate algorithm
-    valid_algorithms = ['minimax', 'minimax_ab', 'iterative', 'random']
-    if algorithm not in valid_algorithms:
-        print(f"ERROR: Invalid algorithm received: '{algorithm}'")
-        print(f"ERROR: Valid algorithms are: {valid_algorithms}")
-        return jsonify({'error': f'Invalid algorithm: "{algorithm}". Valid options: {valid_algorithms}'}), 400
-    
+
+    if algorithm not in VALID_ALGORITHMS:
+        return jsonify({'error': f'Invalid algorithm: "{algorithm}". Valid options: {sorted(VALID_ALGORITHMS)}'}), 400
+
     # Accept an empty board (new game) but reject missing payload
     if board is None:
         return jsonify({'error': 'Board is required'}), 400
     
     start_time = time.time()
-    stats = MinimaxStats()
     best_move = None
     final_depth = depth
-    
+
     try:
-        # Check for immediate wins or blocks first
-        valid_moves = get_valid_moves(board)
+        # Valid columns, center-first: one pass over the top row
+        # replaces get_valid_moves plus a reorder
+        valid_moves = [col for col in CENTER_FIRST if board[0][col] == 0]
         if not valid_moves:
             return jsonify({
                 'move': None,
@@ -107,84 +247,64 @@ def get_move():
                 'depth': 0
             })
         
-        # Check for immediate win
-        for col in valid_moves:
-            row = get_drop_row(board, col)
-            if row == -1:
-                continue
-            new_board = copy_board(board)
-            new_board[row][col] = player
-            if check_win(new_board, row, col, player):
-                decision_time = time.time() - start_time
-                update_metrics(0, 0, decision_time)
-                return jsonify({
-                    'move': col,
-                    'value': 10000,
-                    'nodes_expanded': 1,
-                    'pruned_nodes': 0,
-                    'decision_time': decision_time,
-                    'depth': 0
-                })
-        
-        # Check for opponent's immediate win (must block)
-        opponent = 3 - player
-        for col in valid_moves:
-            row = get_drop_row(board, col)
-            if row == -1:
-                continue
-            new_board = copy_board(board)
-            new_board[row][col] = opponent
-            if check_win(new_board, row, col, opponent):
-                decision_time = time.time() - start_time
-                update_metrics(0, 0, decision_time)
-                return jsonify({
-                    'move': col,
-                    'value': -10000,
-                    'nodes_expanded': 1,
-                    'pruned_nodes': 0,
-                    'decision_time': decision_time,
-                    'depth': 0
-                })
-        
-        # Run the selected algorithm
-        if algorithm == 'random':
-            # Random algorithm - just pick a random valid move (no depth needed)
-            if not valid_moves:
-                return jsonify({
-                    'move': None,
-                    'value': 0,
-                    'nodes_expanded': 0,
-                    'pruned_nodes': 0,
-                    'decision_time': 0,
-                    'depth': 0
-                })
-            best_move = random.choice(valid_moves)
-            value = 0
-            stats.nodes_expanded = 1
-            stats.pruned_nodes = 0  # Explicitly set for random
-        elif algorithm == 'minimax':
-            # Calculate randomness based on depth (lower depth = more randomness/mistakes)
-            randomness = max(0.0, 0.25 - (depth * 0.03))
-            randomness = min(0.2, randomness)  # Cap at 20% for very low depths
-            value, best_move = minimax_without_ab(board, depth, True, player, stats, randomness)
-        elif algorithm == 'minimax_ab':
-            # Calculate randomness based on depth (lower depth = more randomness/mistakes)
-            randomness = max(0.0, 0.25 - (depth * 0.03))
-            randomness = min(0.2, randomness)  # Cap at 20% for very low depths
-            value, best_move = minimax_with_ab(
-                board, depth, float('-inf'), float('inf'), True, player, stats, randomness
+        # Opening book: the empty and one-stone positions have known
+        # best moves, so skip the search (and the threat scan) entirely
+        book_move = OPENING_BOOK.get(_canonical_key(board))
+        if book_move is not None and book_move in valid_moves:
+            decision_time = time.time() - start_time
+            update_metrics(0, 0, decision_time)
+            return jsonify({
+                'move': book_move,
+                'value': 0,
+                'nodes_expanded': 0,
+                'pruned_nodes': 0,
+                'decision_time': decision_time,
+                'depth': 0
+            })
+
+        # Check for immediate wins and forced blocks with the bitboard
+        # threat mask: convert the board once to two ints, then a handful
+        # of shifts replaces place-and-undo win tests over every column.
+        # find_immediate_move already gives wins priority over blocks.
+        bb1, bb2 = board_to_bitboards(board)
+        bb_self, bb_opp = (bb1, bb2) if player == 1 else (bb2, bb1)
+        imm_col, is_winning = find_immediate_move(bb_self, bb_opp)
+        if imm_col is not None:
+            decision_time = time.time() - start_time
+            update_metrics(0, 0, decision_time)
+            return jsonify({
+                'move': imm_col,
+                'value': 10000 if is_winning else -10000,
+                'nodes_expanded': 1,
+                'pruned_nodes': 0,
+                'decision_time': decision_time,
+                'depth': 0
+            })
+
+        # Only searches need stats; the fast returns above skip the
+        # allocation entirely
+        stats = MinimaxStats()
+
+        # Run the selected algorithm via the dispatch table
+        if _EXECUTOR is not None and algorithm != 'random':
+            # Offload the search so the request thread is free and
+            # concurrent games run on separate cores
+            future = _EXECUTOR.submit(
+                _search_worker, pack_board(board), player, algorithm, depth, time_limit
             )
-        elif algorithm == 'iterative':
-            # Calculate randomness based on depth (lower depth = more randomness/mistakes)
-            randomness = max(0.0, 0.25 - (depth * 0.03))
-            randomness = min(0.2, randomness)  # Cap at 20% for very low depths
-            best_move, final_depth, stats = iterative_deepening(
-                board, depth, player, time_limit, randomness
+            # Only iterative deepening honors time_limit; a fixed-depth
+            # search may legitimately run past it, so wait it out rather
+            # than turning a slow-but-valid request into a 500 while the
+            # worker keeps burning CPU on the abandoned search
+            wait = time_limit + 1 if algorithm == 'iterative' else None
+            value, best_move, final_depth, stats.nodes_expanded, stats.pruned_nodes = (
+                future.result(timeout=wait)
             )
-            value = 0  # Iterative deepening doesn't return value directly
         else:
-            return jsonify({'error': f'Invalid algorithm: {algorithm}'}), 400
-        
+            value, best_move, final_depth = ALGO_DISPATCH[algorithm](
+                board, depth, player, time_limit, stats
+            )
+
         # Validate best_move before returning
         if best_move is None or best_move < 0 or best_move >= COLS:
             return jsonify({'error': f'Invalid move returned: {best_move}'}), 500
@@ -194,7 +314,7 @@ def get_move():
         
         return jsonify({
             'move': best_move,
-            'value': value if algorithm != 'iterative' else 0,
+            'value': value,
             'nodes_expanded': stats.nodes_expanded,
             'pruned_nodes': stats.pruned_nodes,
             'decision_time': decision_time,
@@ -204,50 +324,123 @@ def get_move():
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/play_full', methods=['POST'])
+def play_full():
+    """Play a full AI-vs-AI game server-side in one round-trip.
+    Amortizes the HTTP/JSON overhead once per game instead of once per
+    ply, and keeps the transposition table hot across the whole game.
+    """
+    data = request.get_json(cache=False, silent=True)
+    if data is None:
+        return jsonify({'error': 'Request body must be JSON'}), 400
+    time_limit = data.get('time_limit', 5.0)
+
+    configs = {}
+    for key, pl in (('p1', 1), ('p2', 2)):
+        cfg = data.get(key) or {}
+        algorithm = str(cfg.get('algorithm', 'minimax_ab')).strip().lower()
+        if algorithm not in VALID_ALGORITHMS:
+            return jsonify({'error': f'Invalid algorithm for {key}: "{algorithm}". Valid options: {sorted(VALID_ALGORITHMS)}'}), 400
+        try:
+            depth = int(cfg.get('depth', 5))
+        except (TypeError, ValueError):
+            return jsonify({'error': f'Invalid depth for {key}: {cfg.get("depth")}'}), 400
+        configs[pl] = (algorithm, depth)
+
+    clear_tt()
+    board = create_empty_board()
+    moves = []
+    move_stats = []
+    winner = 0
+    player = 1
+    for _ in range(ROWS * COLS):
+        # One pass gives both the playable columns and their drop rows
+        drop_rows = dict(get_valid_moves_with_rows(board))
+        valid_moves = [col for col in CENTER_FIRST if col in drop_rows]
+        if not valid_moves:
+            break
+        algorithm, depth = configs[player]
+        start = time.time()
+        stats = MinimaxStats()
+        _, move, final_depth = ALGO_DISPATCH[algorithm](
+            board, depth, player, time_limit, stats
+        )
+        if move is None or move not in valid_moves:
+            move = valid_moves[0]
+        decision_time = time.time() - start
+
+        row = drop_rows[move]
+        board[row][move] = player
+        moves.append(move)
+        move_stats.append({
+            'player': player,
+            'move': move,
+            'nodes_expanded': stats.nodes_expanded,
+            'pruned_nodes': stats.pruned_nodes,
+            'decision_time': decision_time,
+            'depth': final_depth
+        })
+        update_metrics(stats.nodes_expanded, stats.pruned_nodes, decision_time)
+
+        if check_win(board, row, move, player):
+            winner = player
+            break
+        player = 3 - player
+
+    # Record the finished game the same way /api/game/end does
+    global _metrics_json
+    _metrics_json = None
+    metrics['ai_vs_ai_games_played'] += 1
+    if winner == 1:
+        metrics['ai_vs_ai_player1_wins'] += 1
+    elif winner == 2:
+        metrics['ai_vs_ai_player2_wins'] += 1
+    else:
+        metrics['ai_vs_ai_draws'] += 1
+    clear_tt()
+
+    return jsonify({'moves': moves, 'winner': winner, 'stats': move_stats, 'board': board})
+
 @app.route('/api/metrics', methods=['GET'])
 def get_metrics():
     """Get current game metrics"""
-    avg_nodes = (metrics['total_nodes_expanded'] / metrics['move_count']
-                 if metrics['move_count'] > 0 else 0)
-    avg_time = (metrics['total_decision_time'] / metrics['move_count']
-                if metrics['move_count'] > 0 else 0)
-    avg_pruned = (metrics['total_pruned_nodes'] / metrics['move_count']
-                  if metrics['move_count'] > 0 else 0)
-    
-    # Calculate win rates
-    human_vs_ai_win_rate = (metrics['ai_wins'] / metrics['games_played']
-                            if metrics['games_played'] > 0 else 0)
-    ai_vs_ai_total = metrics['ai_vs_ai_games_played']
-    ai_vs_ai_player1_rate = (metrics['ai_vs_ai_player1_wins'] / ai_vs_ai_total
-                             if ai_vs_ai_total > 0 else 0)
-    ai_vs_ai_player2_rate = (metrics['ai_vs_ai_player2_wins'] / ai_vs_ai_total
-                             if ai_vs_ai_total > 0 else 0)
-    
-    return jsonify({
-        # Human vs AI stats
-        'games_played': metrics['games_played'],
-        'ai_wins': metrics['ai_wins'],
-        'human_wins': metrics['human_wins'],
-        'draws': metrics['draws'],
-        'win_rate': human_vs_ai_win_rate,
-        # AI vs AI stats
-        'ai_vs_ai_games_played': metrics['ai_vs_ai_games_played'],
-        'ai_vs_ai_player1_wins': metrics['ai_vs_ai_player1_wins'],
-        'ai_vs_ai_player2_wins': metrics['ai_vs_ai_player2_wins'],
-        'ai_vs_ai_draws': metrics['ai_vs_ai_draws'],
-        'ai_vs_ai_player1_win_rate': ai_vs_ai_player1_rate,
-        'ai_vs_ai_player2_win_rate': ai_vs_ai_player2_rate,
-        # Performance metrics
-        'average_nodes_expanded': avg_nodes,
-        'average_decision_time': avg_time,
-        'average_pruned_nodes': avg_pruned,
-        'total_moves': metrics['move_count']
-    })
+    global _metrics_json
+    if _metrics_json is None:
+        # Calculate win rates
+        human_vs_ai_win_rate = (metrics['ai_wins'] / metrics['games_played']
+                                if metrics['games_played'] > 0 else 0)
+        ai_vs_ai_total = metrics['ai_vs_ai_games_played']
+        ai_vs_ai_player1_rate = (metrics['ai_vs_ai_player1_wins'] / ai_vs_ai_total
+                                 if ai_vs_ai_total > 0 else 0)
+        ai_vs_ai_player2_rate = (metrics['ai_vs_ai_player2_wins'] / ai_vs_ai_total
+                                 if ai_vs_ai_total > 0 else 0)
+
+        _metrics_json = _dumps_bytes({
+            # Human vs AI stats
+            'games_played': metrics['games_played'],
+            'ai_wins': metrics['ai_wins'],
+            'human_wins': metrics['human_wins'],
+            'draws': metrics['draws'],
+            'win_rate': human_vs_ai_win_rate,
+            # AI vs AI stats
+            'ai_vs_ai_games_played': metrics['ai_vs_ai_games_played'],
+            'ai_vs_ai_player1_wins': metrics['ai_vs_ai_player1_wins'],
+            'ai_vs_ai_player2_wins': metrics['ai_vs_ai_player2_wins'],
+            'ai_vs_ai_draws': metrics['ai_vs_ai_draws'],
+            'ai_vs_ai_player1_win_rate': ai_vs_ai_player1_rate,
+            'ai_vs_ai_player2_win_rate': ai_vs_ai_player2_rate,
+            # Performance metrics
+            'average_nodes_expanded': _avg_nodes_expanded,
+            'average_decision_time': _avg_decision_time,
+            'average_pruned_nodes': _avg_pruned_nodes,
+            'total_moves': _move_count
+        })
+    return app.response_class(_metrics_json, mimetype='application/json')
 
 @app.route('/api/metrics/reset', methods=['POST'])
 def reset_metrics():
     """Reset all metrics"""
-    global metrics
+    global metrics, _move_count, _avg_nodes_expanded, _avg_pruned_nodes, _avg_decision_time, _metrics_json
     metrics = {
         # Human vs AI stats
         'games_played': 0,
@@ -258,22 +451,29 @@ def reset_metrics():
         'ai_vs_ai_games_played': 0,
         'ai_vs_ai_player1_wins': 0,
         'ai_vs_ai_player2_wins': 0,
-        'ai_vs_ai_draws': 0,
-        # Performance metrics
-        'total_nodes_expanded': 0,
-        'total_pruned_nodes': 0,
-        'total_decision_time': 0,
-        'move_count': 0
+        'ai_vs_ai_draws': 0
     }
+    _move_count = 0
+    _avg_nodes_expanded = 0.0
+    _avg_pruned_nodes = 0.0
+    _avg_decision_time = 0.0
+    _metrics_json = None
     return jsonify({'status': 'reset'})
 
 @app.route('/api/game/end', methods=['POST'])
 def game_end():
     """Record game end result"""
+    global _metrics_json
+    _metrics_json = None
     data = request.json
     winner = data.get('winner')  # 1 = player 1, 2 = player 2, 0 = draw
     game_mode = data.get('game_mode', 'ai')  # 'ai' = human vs AI, 'ai_vs_ai' = AI vs AI
-    
+
+    # The transposition table persists across requests so repeated
+    # positions within a game are free; positions from a finished game
+    # won't recur, so drop them here
+    clear_tt()
+
     if game_mode == 'ai_vs_ai':
         # Track AI vs AI games separately
         metrics['ai_vs_ai_games_played'] += 1
@@ -296,11 +496,14 @@ def game_end():
     return jsonify({'status': 'recorded'})
 
 def update_metrics(nodes_expanded, pruned_nodes, decision_time):
-    """Update global metrics"""
-    metrics['move_count'] += 1
-    metrics['total_nodes_expanded'] += nodes_expanded
-    metrics['total_pruned_nodes'] += pruned_nodes
-    metrics['total_decision_time'] += decision_time
+    """Update global per-move metrics as running means"""
+    global _move_count, _avg_nodes_expanded, _avg_pruned_nodes, _avg_decision_time, _metrics_json
+    _move_count += 1
+    n = _move_count
+    _avg_nodes_expanded += (nodes_expanded - _avg_nodes_expanded) / n
+    _avg_pruned_nodes += (pruned_nodes - _avg_pruned_nodes) / n
+    _avg_decision_time += (decision_time - _avg_decision_time) / n
+    _metrics_json = None
 
 if __name__ == '__main__':
     print("Starting Connect Four AI server...")
@@ -314,5 +517,13 @@ if __name__ == '__main__':
     print("  POST /api/metrics/reset - Reset metrics")
     print("  POST /api/game/end  - Record game end")
     print("=" * 50)
-    app.run(debug=True, port=5001, host='127.0.0.1')
+    try:
+        # Waitress is a production WSGI server: multi-threaded, no
+        # reloader, no per-request debug machinery slowing the searches
+        from waitress import serve
+        serve(app, host='127.0.0.1', port=5001, threads=8)
+    except ImportError:
+        # Fall back to the Flask dev server with debug off; debug=True
+        # adds the reloader and traceback capture to every request
+        app.run(debug=False, port=5001, host='127.0.0.1')
 
@@ -4,220 +4,319 @@ Automatically plays games and collects data for EDA and analysis
 """
 import json
 import csv
+import math
 import time
 import random
 import os
 import sys
-from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 
 # Add parent directory to path to import ai module
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 from ai import (
     create_empty_board,
-    copy_board,
     get_valid_moves,
     get_drop_row,
     check_win,
-    is_board_full,
     is_terminal,
     minimax_without_ab,
     minimax_with_ab,
     iterative_deepening,
     MinimaxStats
 )
+from ai.minimax import set_seed, clear_tt, clear_killers
+from ai.bitboard import BITS_PER_COL, find_immediate_move
+from ai.game_state import ROWS, COLS
+
+# CSV schemas, declared up front so writers can be opened before any
+# record exists and rows can stream out as soon as they are produced
+GAME_FIELDS = (
+    'game_id', 'winner', 'total_moves', 'game_duration',
+    'player1_algorithm', 'player1_depth', 'player2_algorithm',
+    'player2_depth', 'timestamp',
+    # Per-game move aggregates, accumulated during play so the
+    # preprocessing pipeline can skip its groupby over all moves
+    'move_nodes_expanded_mean', 'move_nodes_expanded_sum', 'move_nodes_expanded_max',
+    'move_pruned_nodes_mean', 'move_pruned_nodes_sum', 'move_pruned_nodes_max',
+    'move_decision_time_mean', 'move_decision_time_sum', 'move_decision_time_max',
+    'move_column_mean', 'move_column_std'
+)
+MOVE_FIELDS = (
+    'game_id', 'move_number', 'player', 'column', 'row', 'algorithm',
+    'depth', 'nodes_expanded', 'pruned_nodes', 'decision_time',
+    'board_state', 'timestamp'
+)
+
+@contextmanager
+def _open_writers(games_file, moves_file):
+    """Open the two CSV outputs and yield (games_writer, moves_writer)
+    with headers already written. Game records are dicts (DictWriter);
+    move records are plain tuples in MOVE_FIELDS order (csv.writer).
+    """
+    with open(games_file, 'w', newline='') as gf, \
+         open(moves_file, 'w', newline='') as mf:
+        games_writer = csv.DictWriter(gf, fieldnames=GAME_FIELDS)
+        games_writer.writeheader()
+        moves_writer = csv.writer(mf)
+        moves_writer.writerow(MOVE_FIELDS)
+        yield games_writer, moves_writer
+
+def _play_game(game_id, player1_algorithm='minimax_ab', player1_depth=5,
+               player2_algorithm='minimax_ab', player2_depth=5,
+               randomize_first=True):
+    """
+    Play a single game between two AI players.
+    Top-level (not a method) so worker processes can run games without
+    sharing collector state; results are merged by the caller.
+
+    Args:
+        game_id: Identifier written into the game and move records
+        player1_algorithm: Algorithm for player 1 ('minimax', 'minimax_ab', 'iterative', 'random')
+        player1_depth: Search depth for player 1
+        player2_algorithm: Algorithm for player 2
+        player2_depth: Search depth for player 2
+        randomize_first: Whether to randomize starting player
+
+    Returns:
+        (game_result dict, list of move record tuples in MOVE_FIELDS order)
+    """
+    board = create_empty_board()
+    current_player = random.randint(1, 2) if randomize_first else 1
+    move_count = 0
+    game_start_time = time.time()
+
+    # Bitboard mirrors of the board, maintained incrementally so each
+    # move serializes as two small ints (at most ~30 chars vs ~110 for
+    # a JSON board dump) with O(1) parsing on the preprocessing side
+    bb1 = 0
+    bb2 = 0
+
+    game_moves = []
+
+    # One stats object reused across moves (reset per move) instead of
+    # a fresh allocation each iteration
+    stats = MinimaxStats()
+
+    # Running per-game move aggregates, updated O(1) per move so the
+    # preprocessing pipeline does not need a groupby over all moves
+    agg = {
+        'nodes_sum': 0, 'nodes_max': 0,
+        'pruned_sum': 0, 'pruned_max': 0,
+        'time_sum': 0.0, 'time_max': 0.0,
+        'col_sum': 0, 'col_sq_sum': 0
+    }
+
+    def _game_result(winner):
+        """Build the game record, deriving the aggregate features from
+        the running sums (same names the groupby used to produce).
+        """
+        n = len(game_moves)
+        if n >= 2:
+            # Sample std (ddof=1), matching pandas
+            variance = (agg['col_sq_sum'] - agg['col_sum'] ** 2 / n) / (n - 1)
+            col_std = math.sqrt(max(variance, 0.0))
+        else:
+            col_std = float('nan')
+        return {
+            'game_id': game_id,
+            'winner': winner,
+            'total_moves': move_count,
+            'game_duration': time.time() - game_start_time,
+            'player1_algorithm': player1_algorithm,
+            'player1_depth': player1_depth,
+            'player2_algorithm': player2_algorithm,
+            'player2_depth': player2_depth,
+            'timestamp': game_start_time,
+            'move_nodes_expanded_mean': agg['nodes_sum'] / n if n else 0.0,
+            'move_nodes_expanded_sum': agg['nodes_sum'],
+            'move_nodes_expanded_max': agg['nodes_max'],
+            'move_pruned_nodes_mean': agg['pruned_sum'] / n if n else 0.0,
+            'move_pruned_nodes_sum': agg['pruned_sum'],
+            'move_pruned_nodes_max': agg['pruned_max'],
+            'move_decision_time_mean': agg['time_sum'] / n if n else 0.0,
+            'move_decision_time_sum': agg['time_sum'],
+            'move_decision_time_max': agg['time_max'],
+            'move_column_mean': agg['col_sum'] / n if n else 0.0,
+            'move_column_std': col_std
+        }
+
+    while True:
+        move_count += 1
+
+        # Determine which algorithm to use
+        if current_player == 1:
+            algorithm = player1_algorithm
+            depth = player1_depth
+        else:
+            algorithm = player2_algorithm
+            depth = player2_depth
+
+        # Get valid moves
+        valid_moves = get_valid_moves(board)
+        if not valid_moves:
+            # Draw
+            return _game_result(0), game_moves
+
+        # Make move
+        move_start_time = time.time()
+        stats.reset()
+        best_move = None
+
+        # Forced move: nothing to probe or search
+        if len(valid_moves) == 1:
+            best_move = valid_moves[0]
+            stats.nodes_expanded = 1
+
+        # Check for immediate wins/blocks first: the bitboards are already
+        # maintained incrementally, so use the compiled threat-mask kernels
+        # instead of place-and-undo probes per column
+        if best_move is None:
+            if current_player == 1:
+                bb_self, bb_opp = bb1, bb2
+            else:
+                bb_self, bb_opp = bb2, bb1
+            move, _ = find_immediate_move(bb_self, bb_opp)
+            if move is not None:
+                best_move = move
+                stats.nodes_expanded = 1
+
+        # Use algorithm if no immediate win/block
+        if best_move is None:
+            # Calculate randomness based on depth (same as app.py)
+            randomness = max(0.0, 0.25 - (depth * 0.03))
+            randomness = min(0.2, randomness)
+
+            if algorithm == 'random':
+                best_move = random.choice(valid_moves)
+                stats.nodes_expanded = 1
+            elif algorithm == 'minimax':
+                _, best_move = minimax_without_ab(
+                    board, depth, True, current_player, stats, randomness
+                )
+            elif algorithm == 'minimax_ab':
+                _, best_move = minimax_with_ab(
+                    board, depth, float('-inf'), float('inf'), True, current_player, stats, randomness
+                )
+            elif algorithm == 'iterative':
+                best_move, final_depth, stats = iterative_deepening(
+                    board, depth, current_player, time_limit=5.0, randomness=randomness
+                )
+
+        move_time = time.time() - move_start_time
+
+        # Record move data
+        row = get_drop_row(board, best_move)
+        board[row][best_move] = current_player
+        bit = 1 << (best_move * BITS_PER_COL + (ROWS - 1 - row))
+        if current_player == 1:
+            bb1 |= bit
+        else:
+            bb2 |= bit
+
+        # Move records are tuples in MOVE_FIELDS order: cheaper to build
+        # and to pickle back from the workers than a dict per move.
+        # board_state is the two bitboard ints; timestamp the float epoch
+        game_moves.append((
+            game_id, move_count, current_player, best_move, row,
+            algorithm, depth, stats.nodes_expanded, stats.pruned_nodes,
+            move_time, f'{bb1}:{bb2}', move_start_time
+        ))
+
+        agg['nodes_sum'] += stats.nodes_expanded
+        if stats.nodes_expanded > agg['nodes_max']:
+            agg['nodes_max'] = stats.nodes_expanded
+        agg['pruned_sum'] += stats.pruned_nodes
+        if stats.pruned_nodes > agg['pruned_max']:
+            agg['pruned_max'] = stats.pruned_nodes
+        agg['time_sum'] += move_time
+        if move_time > agg['time_max']:
+            agg['time_max'] = move_time
+        agg['col_sum'] += best_move
+        agg['col_sq_sum'] += best_move * best_move
+
+        # Check for win
+        if check_win(board, row, best_move, current_player):
+            return _game_result(current_player), game_moves
+
+        # Check for draw: every iteration places exactly one piece, so
+        # the board is full exactly when 42 moves have been made
+        if move_count >= ROWS * COLS:
+            return _game_result(0), game_moves
+
+        # Switch player
+        current_player = 3 - current_player
+
+def _play_game_worker(config):
+    """Run one configured game in a worker process.
+    Seeds the RNGs from the config so parallel runs stay reproducible.
+    """
+    game_id, alg1, depth1, alg2, depth2, seed = config
+    random.seed(seed)
+    set_seed(seed)
+    # Start from clean search tables so a game's result depends only on
+    # its seed, not on which games the worker ran before it. Within the
+    # game the transposition table persists across moves, so positions
+    # reached again later in the same game are O(1) lookups
+    clear_tt()
+    clear_killers()
+    return _play_game(
+        game_id,
+        player1_algorithm=alg1,
+        player1_depth=depth1,
+        player2_algorithm=alg2,
+        player2_depth=depth2,
+        randomize_first=True
+    )
 
 class GameDataCollector:
     """Collects game data for analysis"""
-    
+
     def __init__(self):
         self.games_data = []
         self.move_data = []
-    
+        self.moves_recorded = 0
+
     def play_game(self, player1_algorithm='minimax_ab', player1_depth=5,
                   player2_algorithm='minimax_ab', player2_depth=5,
                   randomize_first=True):
-        """
-        Play a single game between two AI players
-        
-        Args:
-            player1_algorithm: Algorithm for player 1 ('minimax', 'minimax_ab', 'iterative', 'random')
-            player1_depth: Search depth for player 1
-            player2_algorithm: Algorithm for player 2
-            player2_depth: Search depth for player 2
-            randomize_first: Whether to randomize starting player
-        
-        Returns:
-            Dictionary with game results
-        """
-        board = create_empty_board()
-        current_player = random.randint(1, 2) if randomize_first else 1
-        move_count = 0
-        game_start_time = time.time()
-        
-        # Game metadata
-        game_id = len(self.games_data)
-        game_moves = []
-        
-        while True:
-            move_count += 1
-            
-            # Determine which algorithm to use
-            if current_player == 1:
-                algorithm = player1_algorithm
-                depth = player1_depth
-            else:
-                algorithm = player2_algorithm
-                depth = player2_depth
-            
-            # Get valid moves
-            valid_moves = get_valid_moves(board)
-            if not valid_moves:
-                # Draw
-                game_end_time = time.time()
-                game_duration = game_end_time - game_start_time
-                
-                game_result = {
-                    'game_id': game_id,
-                    'winner': 0,  # Draw
-                    'total_moves': move_count,
-                    'game_duration': game_duration,
-                    'player1_algorithm': player1_algorithm,
-                    'player1_depth': player1_depth,
-                    'player2_algorithm': player2_algorithm,
-                    'player2_depth': player2_depth,
-                    'timestamp': datetime.now().isoformat()
-                }
-                self.games_data.append(game_result)
-                return game_result
-            
-            # Make move
-            move_start_time = time.time()
-            stats = MinimaxStats()
-            best_move = None
-            
-            # Check for immediate wins/blocks first
-            for col in valid_moves:
-                row = get_drop_row(board, col)
-                if row == -1:
-                    continue
-                new_board = copy_board(board)
-                new_board[row][col] = current_player
-                if check_win(new_board, row, col, current_player):
-                    best_move = col
-                    stats.nodes_expanded = 1
-                    break
-            
-            if best_move is None:
-                # Check for opponent's immediate win
-                opponent = 3 - current_player
-                for col in valid_moves:
-                    row = get_drop_row(board, col)
-                    if row == -1:
-                        continue
-                    new_board = copy_board(board)
-                    new_board[row][col] = opponent
-                    if check_win(new_board, row, col, opponent):
-                        best_move = col
-                        stats.nodes_expanded = 1
-                        break
-            
-            # Use algorithm if no immediate win/block
-            if best_move is None:
-                # Calculate randomness based on depth (same as app.py)
-                randomness = max(0.0, 0.25 - (depth * 0.03))
-                randomness = min(0.2, randomness)
-                
-                if algorithm == 'random':
-                    best_move = random.choice(valid_moves)
-                    stats.nodes_expanded = 1
-                elif algorithm == 'minimax':
-                    _, best_move = minimax_without_ab(
-                        board, depth, True, current_player, stats, randomness
-                    )
-                elif algorithm == 'minimax_ab':
-                    _, best_move = minimax_with_ab(
-                        board, depth, float('-inf'), float('inf'), True, current_player, stats, randomness
-                    )
-                elif algorithm == 'iterative':
-                    best_move, final_depth, stats = iterative_deepening(
-                        board, depth, current_player, time_limit=5.0, randomness=randomness
-                    )
-            
-            move_time = time.time() - move_start_time
-            
-            # Record move data
-            row = get_drop_row(board, best_move)
-            board[row][best_move] = current_player
-            
-            move_record = {
-                'game_id': game_id,
-                'move_number': move_count,
-                'player': current_player,
-                'column': best_move,
-                'row': row,
-                'algorithm': algorithm,
-                'depth': depth,
-                'nodes_expanded': stats.nodes_expanded,
-                'pruned_nodes': stats.pruned_nodes,
-                'decision_time': move_time,
-                'board_state': json.dumps(board),  # Store as JSON string
-                'timestamp': datetime.now().isoformat()
-            }
-            self.move_data.append(move_record)
-            game_moves.append(move_record)
-            
-            # Check for win
-            if check_win(board, row, best_move, current_player):
-                game_end_time = time.time()
-                game_duration = game_end_time - game_start_time
-                
-                game_result = {
-                    'game_id': game_id,
-                    'winner': current_player,
-                    'total_moves': move_count,
-                    'game_duration': game_duration,
-                    'player1_algorithm': player1_algorithm,
-                    'player1_depth': player1_depth,
-                    'player2_algorithm': player2_algorithm,
-                    'player2_depth': player2_depth,
-                    'timestamp': datetime.now().isoformat()
-                }
-                self.games_data.append(game_result)
-                return game_result
-            
-            # Check for draw
-            if is_board_full(board):
-                game_end_time = time.time()
-                game_duration = game_end_time - game_start_time
-                
-                game_result = {
-                    'game_id': game_id,
-                    'winner': 0,
-                    'total_moves': move_count,
-                    'game_duration': game_duration,
-                    'player1_algorithm': player1_algorithm,
-                    'player1_depth': player1_depth,
-                    'player2_algorithm': player2_algorithm,
-                    'player2_depth': player2_depth,
-                    'timestamp': datetime.now().isoformat()
-                }
-                self.games_data.append(game_result)
-                return game_result
-            
-            # Switch player
-            current_player = 3 - current_player
-    
-    def collect_games(self, num_games=200, 
+        """Play a single game and record it. Returns the game result dict"""
+        game_result, game_moves = _play_game(
+            len(self.games_data),
+            player1_algorithm=player1_algorithm,
+            player1_depth=player1_depth,
+            player2_algorithm=player2_algorithm,
+            player2_depth=player2_depth,
+            randomize_first=randomize_first
+        )
+        self.games_data.append(game_result)
+        self.move_data.extend(game_moves)
+        self.moves_recorded += len(game_moves)
+        return game_result
+
+    def collect_games(self, num_games=200,
                      algorithms=['minimax', 'minimax_ab', 'iterative'],
-                     depths=[3, 5, 7]):
+                     depths=[3, 5, 7],
+                     games_file=None, moves_file=None):
         """
-        Collect multiple games with different configurations
-        
+        Collect multiple games with different configurations.
+        Records stream straight to the CSV files as each game finishes,
+        so memory stays bounded regardless of run size; only the small
+        per-game results are kept for the summary.
+
         Args:
             num_games: Number of games to play
             algorithms: List of algorithms to test
             depths: List of depths to test
+            games_file: Games CSV path (default: data/game_data.csv)
+            moves_file: Moves CSV path (default: data/move_data.csv)
         """
+        data_dir = os.path.dirname(os.path.abspath(__file__))
+        if games_file is None:
+            games_file = os.path.join(data_dir, 'game_data.csv')
+        if moves_file is None:
+            moves_file = os.path.join(data_dir, 'move_data.csv')
+
         print(f"Starting data collection: {num_games} games")
         print("=" * 60)
         
@@ -230,35 +329,47 @@ class GameDataCollector:
         
         # Randomize configurations
         random.shuffle(game_configs)
-        
-        games_per_config = max(1, num_games // len(game_configs))
+
         total_collected = 0
-        
-        for i, (alg1, depth1, alg2, depth2) in enumerate(game_configs[:num_games]):
-            if total_collected >= num_games:
-                break
-            
-            try:
-                result = self.play_game(
-                    player1_algorithm=alg1,
-                    player1_depth=depth1,
-                    player2_algorithm=alg2,
-                    player2_depth=depth2,
-                    randomize_first=True
-                )
+
+        # Play games across all cores: each worker runs complete games
+        # (root parallelism at game granularity) and the parent merges
+        # the records, so no state is shared during the search itself.
+        # Splitting the 7 root columns of a single move across processes
+        # instead would lose alpha-beta cutoffs between siblings and
+        # fight this pool for cores, so moves stay sequential per worker
+        configs = [
+            (len(self.games_data) + i, alg1, depth1, alg2, depth2, random.getrandbits(63))
+            for i, (alg1, depth1, alg2, depth2) in enumerate(game_configs[:num_games])
+        ]
+        total_moves_recorded = 0
+        with _open_writers(games_file, moves_file) as (games_writer, moves_writer), \
+             ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            futures = [executor.submit(_play_game_worker, config) for config in configs]
+            for i, future in enumerate(futures):
+                try:
+                    result, game_moves = future.result()
+                except Exception as e:
+                    print(f"Error in game {i}: {e}")
+                    continue
+                # Stream the records out immediately instead of buffering
+                # every move dict until the end of the run
+                games_writer.writerow(result)
+                moves_writer.writerows(game_moves)
+                self.games_data.append(result)
+                total_moves_recorded += len(game_moves)
                 total_collected += 1
-                
+
                 if total_collected % 10 == 0:
                     print(f"Progress: {total_collected}/{num_games} games collected")
                     print(f"  Last game: {result['winner']} won in {result['total_moves']} moves")
-            
-            except Exception as e:
-                print(f"Error in game {total_collected}: {e}")
-                continue
-        
+
         print("=" * 60)
         print(f"Data collection complete: {total_collected} games collected")
-        print(f"Total moves recorded: {len(self.move_data)}")
+        print(f"Total moves recorded: {total_moves_recorded}")
+        print(f"Saved games to {games_file}")
+        print(f"Saved moves to {moves_file}")
+        self.moves_recorded = total_moves_recorded
     
     def save_to_csv(self, games_file=None, moves_file=None):
         """Save collected data to CSV files"""
@@ -277,11 +388,11 @@ class GameDataCollector:
                 writer.writerows(self.games_data)
             print(f"Saved {len(self.games_data)} games to {games_file}")
         
-        # Save moves data
+        # Save moves data (tuples in MOVE_FIELDS order)
         if self.move_data:
             with open(moves_file, 'w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=self.move_data[0].keys())
-                writer.writeheader()
+                writer = csv.writer(f)
+                writer.writerow(MOVE_FIELDS)
                 writer.writerows(self.move_data)
             print(f"Saved {len(self.move_data)} moves to {moves_file}")
     
@@ -301,7 +412,8 @@ class GameDataCollector:
         
         if self.move_data:
             with open(moves_file, 'w') as f:
-                json.dump(self.move_data, f, indent=2)
+                json.dump([dict(zip(MOVE_FIELDS, move)) for move in self.move_data],
+                          f, indent=2)
             print(f"Saved {len(self.move_data)} moves to {moves_file}")
 
 
@@ -309,17 +421,14 @@ def main():
     """Main function to run data collection"""
     collector = GameDataCollector()
     
-    # Collect games with various configurations
+    # Collect games with various configurations; records stream to the
+    # CSV files during the run, so there is nothing left to save here
     collector.collect_games(
         num_games=200,
         algorithms=['minimax', 'minimax_ab', 'iterative'],
         depths=[3, 5, 7]
     )
-    
-    # Save data
-    collector.save_to_csv()
-    collector.save_to_json()
-    
+
     # Print summary statistics
     print("\n" + "=" * 60)
     print("Summary Statistics:")
@@ -336,7 +445,7 @@ def main():
         print(f"Draws: {winners.count(0)}")
         print(f"Average moves per game: {sum(total_moves) / len(total_moves):.2f}")
         print(f"Average game duration: {sum(durations) / len(durations):.2f}s")
-        print(f"Total moves recorded: {len(collector.move_data)}")
+        print(f"Total moves recorded: {collector.moves_recorded}")
 
 
 if __name__ == '__main__':
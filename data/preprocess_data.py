@@ -8,6 +8,73 @@ import json
 import os
 from typing import Dict, List, Tuple
 
+# Bitboard layout used in move_data board_state ("p1:p2"): 7 bits per
+# column, bit (col * 7 + r) is the cell r rows above the bottom
+BITS_PER_COL = 7
+COL_MASK = 0x3F  # 6 playable bits of a column
+ROW_MASKS = [
+    sum(1 << (col * BITS_PER_COL + r) for col in range(7))
+    for r in range(6)
+]
+COL_MASKS = [COL_MASK << (col * BITS_PER_COL) for col in range(7)]
+
+# Explicit CSV schemas: skips pandas' dtype inference scan, keeps small
+# counts in small ints and low-cardinality algorithm names as category
+GAMES_DTYPES = {
+    'game_id': 'int32',
+    'winner': 'int8',
+    'total_moves': 'int16',
+    'game_duration': 'float32',
+    'player1_algorithm': 'category',
+    'player1_depth': 'int8',
+    'player2_algorithm': 'category',
+    'player2_depth': 'int8',
+    'timestamp': 'string'
+}
+MOVES_DTYPES = {
+    'game_id': 'int32',
+    'move_number': 'int16',
+    'player': 'int8',
+    'column': 'int8',
+    'row': 'int8',
+    'algorithm': 'category',
+    'depth': 'int8',
+    'nodes_expanded': 'int64',
+    'pruned_nodes': 'int64',
+    'decision_time': 'float32',
+    'board_state': 'string',
+    'timestamp': 'string'
+}
+
+def _parquet_path(csv_path):
+    """Parquet sibling of a CSV path"""
+    root, ext = os.path.splitext(csv_path)
+    return root + '.parquet'
+
+def _write_frame(df, csv_path):
+    """Write a frame as Parquet (snappy) when an engine is available,
+    falling back to CSV. Returns the path actually written.
+    """
+    try:
+        path = _parquet_path(csv_path)
+        df.to_parquet(path, compression='snappy')
+        return path
+    except ImportError:
+        df.to_csv(csv_path, index=False)
+        return csv_path
+
+def _read_frame(csv_path, dtypes):
+    """Read a frame, preferring a Parquet sibling (which preserves the
+    dtypes it was written with) over the CSV.
+    """
+    path = _parquet_path(csv_path)
+    if os.path.exists(path):
+        try:
+            return pd.read_parquet(path)
+        except ImportError:
+            pass
+    return pd.read_csv(csv_path, dtype=dtypes, engine='c', low_memory=False)
+
 class Connect4Preprocessor:
     """Preprocess Connect 4 game data for analysis"""
     
@@ -26,12 +93,13 @@ class Connect4Preprocessor:
         self.moves_df = None
         self.processed_games_df = None
         self.processed_moves_df = None
+        self._stats_cache = None
     
     def load_data(self):
         """Load data from CSV files"""
         print("Loading data...")
-        self.games_df = pd.read_csv(self.games_file)
-        self.moves_df = pd.read_csv(self.moves_file)
+        self.games_df = _read_frame(self.games_file, GAMES_DTYPES)
+        self.moves_df = _read_frame(self.moves_file, MOVES_DTYPES)
         print(f"Loaded {len(self.games_df)} games and {len(self.moves_df)} moves")
     
     def handle_missing_values(self):
@@ -64,6 +132,27 @@ class Connect4Preprocessor:
         
         print("Missing values handled")
     
+    # Columns the outlier passes look at, per frame attribute
+    _OUTLIER_COLS = {
+        'games_df': ['total_moves', 'game_duration'],
+        'moves_df': ['nodes_expanded', 'decision_time', 'pruned_nodes']
+    }
+
+    def _numeric_stats(self):
+        """Mean/std per outlier column, computed once and shared between
+        detect_outliers and handle_outliers (invalidated when the
+        frames are modified).
+        """
+        if self._stats_cache is None:
+            cache = {}
+            for attr, numeric_cols in self._OUTLIER_COLS.items():
+                df = getattr(self, attr)
+                cols = [col for col in numeric_cols if col in df.columns]
+                arr = df[cols].to_numpy(dtype=float)
+                cache[attr] = (cols, arr.mean(axis=0), arr.std(axis=0, ddof=1))
+            self._stats_cache = cache
+        return self._stats_cache
+
     def detect_outliers(self, threshold=3):
         """
         Detect outliers using Z-score method
@@ -76,30 +165,23 @@ class Connect4Preprocessor:
         """
         print("\nDetecting outliers...")
         outliers_info = {}
-        
-        # Detect outliers in games data
-        numeric_cols = ['total_moves', 'game_duration']
-        for col in numeric_cols:
-            z_scores = np.abs((self.games_df[col] - self.games_df[col].mean()) / self.games_df[col].std())
-            outliers = self.games_df[z_scores > threshold]
-            outliers_info[f'games_{col}'] = {
-                'count': len(outliers),
-                'indices': outliers.index.tolist()
-            }
-            print(f"  {col}: {len(outliers)} outliers detected")
-        
-        # Detect outliers in moves data
-        numeric_cols = ['nodes_expanded', 'decision_time', 'pruned_nodes']
-        for col in numeric_cols:
-            if col in self.moves_df.columns:
-                z_scores = np.abs((self.moves_df[col] - self.moves_df[col].mean()) / self.moves_df[col].std())
-                outliers = self.moves_df[z_scores > threshold]
-                outliers_info[f'moves_{col}'] = {
-                    'count': len(outliers),
-                    'indices': outliers.index.tolist()
+
+        # One contiguous NumPy pass per frame instead of a fresh Series
+        # per column: broadcast the z-scores for all columns at once
+        for attr, (cols, mu, sd) in self._numeric_stats().items():
+            df = getattr(self, attr)
+            prefix = attr[:-3]
+            arr = df[cols].to_numpy(dtype=float)
+            z_scores = np.abs((arr - mu) / sd)
+            mask = z_scores > threshold
+            for j, col in enumerate(cols):
+                count = int(mask[:, j].sum())
+                outliers_info[f'{prefix}_{col}'] = {
+                    'count': count,
+                    'indices': df.index[mask[:, j]].tolist()
                 }
-                print(f"  {col}: {len(outliers)} outliers detected")
-        
+                print(f"  {col}: {count} outliers detected")
+
         return outliers_info
     
     def handle_outliers(self, method='cap', threshold=3):
@@ -111,96 +193,147 @@ class Connect4Preprocessor:
             threshold: Z-score threshold
         """
         print(f"\nHandling outliers using {method} method...")
-        
-        # Handle outliers in games data
-        numeric_cols = ['total_moves', 'game_duration']
-        for col in numeric_cols:
-            z_scores = np.abs((self.games_df[col] - self.games_df[col].mean()) / self.games_df[col].std())
+
+        # Same single-pass layout as detect_outliers, reusing its column
+        # stats: build the bounds for every column at once and cap (or
+        # filter) in one assignment
+        for attr, (cols, mu, sd) in self._numeric_stats().items():
+            df = getattr(self, attr)
+            arr = df[cols].to_numpy(dtype=float)
             if method == 'cap':
-                # Cap outliers at threshold
-                upper_bound = self.games_df[col].mean() + threshold * self.games_df[col].std()
-                lower_bound = self.games_df[col].mean() - threshold * self.games_df[col].std()
-                self.games_df[col] = self.games_df[col].clip(lower=lower_bound, upper=upper_bound)
+                # Per-column bound vectors, applied to the whole block in
+                # one clip and one write-back
+                lower_bound = mu - threshold * sd
+                upper_bound = mu + threshold * sd
+                df[cols] = np.clip(arr, lower_bound, upper_bound)
             elif method == 'remove':
-                self.games_df = self.games_df[z_scores <= threshold]
-        
-        # Handle outliers in moves data
-        numeric_cols = ['nodes_expanded', 'decision_time', 'pruned_nodes']
-        for col in numeric_cols:
-            if col in self.moves_df.columns:
-                z_scores = np.abs((self.moves_df[col] - self.moves_df[col].mean()) / self.moves_df[col].std())
-                if method == 'cap':
-                    upper_bound = self.moves_df[col].mean() + threshold * self.moves_df[col].std()
-                    lower_bound = self.moves_df[col].mean() - threshold * self.moves_df[col].std()
-                    self.moves_df[col] = self.moves_df[col].clip(lower=lower_bound, upper=upper_bound)
-                elif method == 'remove':
-                    self.moves_df = self.moves_df[z_scores <= threshold]
-        
+                z_scores = np.abs((arr - mu) / sd)
+                setattr(self, attr, df[(z_scores <= threshold).all(axis=1)])
+
+        # The frames changed, so the cached stats no longer describe them
+        self._stats_cache = None
+
         print("Outliers handled")
     
     def extract_board_features(self, board_state: str) -> Dict:
         """
         Extract features from board state
-        
+
         Args:
-            board_state: JSON string of board state
-        
+            board_state: 'p1:p2' bitboard ints (legacy data: JSON board)
+
         Returns:
             Dictionary of extracted features
         """
         try:
-            board = json.loads(board_state)
+            if ':' in board_state:
+                p1, p2 = (int(part) for part in board_state.split(':'))
+            else:
+                # Legacy JSON row lists: fold into the same bitboard layout
+                board = json.loads(board_state)
+                p1 = 0
+                p2 = 0
+                for row in range(6):
+                    for col in range(7):
+                        cell = board[row][col]
+                        if cell:
+                            bit = 1 << (col * BITS_PER_COL + (5 - row))
+                            if cell == 1:
+                                p1 |= bit
+                            else:
+                                p2 |= bit
+
             features = {}
-            
-            # Count pieces
-            player1_pieces = sum(row.count(1) for row in board)
-            player2_pieces = sum(row.count(2) for row in board)
-            empty_cells = sum(row.count(0) for row in board)
-            
+            occupied = p1 | p2
+
+            # Count pieces via popcounts
+            player1_pieces = p1.bit_count()
+            player2_pieces = p2.bit_count()
+
             features['player1_pieces'] = player1_pieces
             features['player2_pieces'] = player2_pieces
-            features['empty_cells'] = empty_cells
+            features['empty_cells'] = 42 - player1_pieces - player2_pieces
             features['total_pieces'] = player1_pieces + player2_pieces
-            
+
             # Center control
-            center_col = 3
-            center_pieces_p1 = sum(board[row][center_col] == 1 for row in range(6))
-            center_pieces_p2 = sum(board[row][center_col] == 2 for row in range(6))
-            features['center_control_p1'] = center_pieces_p1
-            features['center_control_p2'] = center_pieces_p2
-            
+            center_mask = COL_MASKS[3]
+            features['center_control_p1'] = (p1 & center_mask).bit_count()
+            features['center_control_p2'] = (p2 & center_mask).bit_count()
+
             # Column heights (how many pieces in each column)
-            column_heights = [sum(board[row][col] != 0 for row in range(6)) for col in range(7)]
-            for i, height in enumerate(column_heights):
-                features[f'col_{i}_height'] = height
-            
-            # Board density (pieces per row)
-            row_densities = [sum(board[row][col] != 0 for col in range(7)) for row in range(6)]
-            for i, density in enumerate(row_densities):
-                features[f'row_{i}_density'] = density
-            
+            for i in range(7):
+                features[f'col_{i}_height'] = (occupied & COL_MASKS[i]).bit_count()
+
+            # Board density (pieces per row); row 0 is the top of the board
+            for i in range(6):
+                features[f'row_{i}_density'] = (occupied & ROW_MASKS[5 - i]).bit_count()
+
             return features
-        
+
         except:
             return {}
     
+    def extract_board_features_batch(self, board_states):
+        """
+        Extract board features for every move in one vectorized pass
+
+        Args:
+            board_states: Series of 'p1:p2' bitboard strings
+
+        Returns:
+            Dict of feature name -> array, one value per input row
+        """
+        parts = board_states.str.split(':', n=1, expand=True)
+        p1 = parts[0].astype(np.uint64).to_numpy()
+        p2 = parts[1].astype(np.uint64).to_numpy()
+        occupied = p1 | p2
+
+        features = {}
+        player1_pieces = np.bitwise_count(p1)
+        player2_pieces = np.bitwise_count(p2)
+        features['player1_pieces'] = player1_pieces
+        features['player2_pieces'] = player2_pieces
+        features['empty_cells'] = 42 - player1_pieces - player2_pieces
+        features['total_pieces'] = player1_pieces + player2_pieces
+
+        center_mask = np.uint64(COL_MASKS[3])
+        features['center_control_p1'] = np.bitwise_count(p1 & center_mask)
+        features['center_control_p2'] = np.bitwise_count(p2 & center_mask)
+
+        for i in range(7):
+            features[f'col_{i}_height'] = np.bitwise_count(occupied & np.uint64(COL_MASKS[i]))
+
+        for i in range(6):
+            features[f'row_{i}_density'] = np.bitwise_count(occupied & np.uint64(ROW_MASKS[5 - i]))
+
+        return features
+
     def engineer_features(self):
         """Engineer new features from existing data"""
         print("\nEngineering features...")
-        
+
         # Extract board features from moves data
         if 'board_state' in self.moves_df.columns:
             print("  Extracting board features...")
-            board_features = self.moves_df['board_state'].apply(self.extract_board_features)
-            board_features_df = pd.DataFrame(board_features.tolist())
-            self.moves_df = pd.concat([self.moves_df, board_features_df], axis=1)
+            states = self.moves_df['board_state'].astype(str)
+            if states.str.contains(':').all():
+                # Bitboard format: one vectorized pass over the whole
+                # column, assigned in a single new frame rather than a
+                # concat that re-materializes both sides
+                self.moves_df = self.moves_df.assign(**self.extract_board_features_batch(states))
+            else:
+                # Legacy JSON rows: fall back to per-row extraction
+                board_features = states.apply(self.extract_board_features)
+                board_features_df = pd.DataFrame(board_features.tolist())
+                self.moves_df = pd.concat([self.moves_df, board_features_df], axis=1)
         
         # Create game-level features
         print("  Creating game-level features...")
         
-        # Algorithm combinations
+        # Algorithm combinations (astype(str): the columns load as category)
         self.games_df['algorithm_matchup'] = (
-            self.games_df['player1_algorithm'] + '_vs_' + self.games_df['player2_algorithm']
+            self.games_df['player1_algorithm'].astype(str) + '_vs_' +
+            self.games_df['player2_algorithm'].astype(str)
         )
         
         # Depth combinations
@@ -223,20 +356,25 @@ class Connect4Preprocessor:
         
         # Create move-level aggregated features
         print("  Creating move-level aggregated features...")
-        move_aggregates = self.moves_df.groupby('game_id').agg({
-            'nodes_expanded': ['mean', 'sum', 'max'],
-            'pruned_nodes': ['mean', 'sum', 'max'],
-            'decision_time': ['mean', 'sum', 'max'],
-            'column': ['mean', 'std']
-        }).reset_index()
-        
-        move_aggregates.columns = ['game_id'] + [
-            f'move_{col[0]}_{col[1]}' for col in move_aggregates.columns[1:]
-        ]
-        
-        # Merge with games data
-        self.games_df = self.games_df.merge(move_aggregates, on='game_id', how='left')
-        
+        if 'move_nodes_expanded_mean' in self.games_df.columns:
+            # The collector accumulated these during play; the groupby
+            # below only remains for data recorded before that change
+            print("  Using aggregates precomputed during collection")
+        else:
+            move_aggregates = self.moves_df.groupby('game_id').agg({
+                'nodes_expanded': ['mean', 'sum', 'max'],
+                'pruned_nodes': ['mean', 'sum', 'max'],
+                'decision_time': ['mean', 'sum', 'max'],
+                'column': ['mean', 'std']
+            }).reset_index()
+
+            move_aggregates.columns = ['game_id'] + [
+                f'move_{col[0]}_{col[1]}' for col in move_aggregates.columns[1:]
+            ]
+
+            # Merge with games data
+            self.games_df = self.games_df.merge(move_aggregates, on='game_id', how='left')
+
         print("Feature engineering complete")
     
     def normalize_data(self, columns_to_normalize=None):
@@ -361,12 +499,12 @@ class Connect4Preprocessor:
             moves_file = os.path.join(data_dir, 'processed_move_data.csv')
         
         if self.processed_games_df is not None:
-            self.processed_games_df.to_csv(games_file, index=False)
-            print(f"Saved processed games data to {games_file}")
-        
+            written = _write_frame(self.processed_games_df, games_file)
+            print(f"Saved processed games data to {written}")
+
         if self.processed_moves_df is not None:
-            self.processed_moves_df.to_csv(moves_file, index=False)
-            print(f"Saved processed moves data to {moves_file}")
+            written = _write_frame(self.processed_moves_df, moves_file)
+            print(f"Saved processed moves data to {written}")
 
 
 def main():
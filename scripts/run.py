@@ -8,6 +8,7 @@ import sys
 import subprocess
 import os
 import platform
+from importlib.metadata import PackageNotFoundError, version
 
 def check_python_version():
     """Check if Python version is 3.7 or higher"""
@@ -20,12 +21,14 @@ def check_python_version():
 
 def check_dependencies():
     """Check if required packages are installed"""
+    # Metadata lookups are a file stat each, unlike importing flask which
+    # pulls in the whole package at launch.
     try:
-        import flask
-        import flask_cors
+        version('flask')
+        version('waitress')
         print("✓ Dependencies are installed")
         return True
-    except ImportError:
+    except PackageNotFoundError:
         print("⚠ Dependencies not found. Installing...")
         return False
 
@@ -1,60 +1,144 @@
 """
-Simple test script to verify AI implementation
+Test and micro-benchmark harness for the AI implementation.
+
+Run under pytest for the correctness checks:
+    python -m pytest -q test_ai.py
+or as a script to also get the timing report:
+    python test_ai.py
+
+The benchmark uses seeded boards and clears the search tables before
+every measured call, so numbers are comparable across runs and
+branches — this is the feedback loop for search optimizations.
 """
+import math
+import random
+import statistics
+import time
+
 from ai import (
     create_empty_board,
+    get_valid_moves,
+    is_terminal,
     minimax_without_ab,
     minimax_with_ab,
     iterative_deepening,
     MinimaxStats,
     drop_piece
 )
+from ai.minimax import set_seed, clear_tt, clear_killers
+
+BENCH_SEED = 42
+BENCH_WARMUP = 2
+BENCH_ITERS = 10
+
+
+def _seeded_board(n_moves=8, seed=BENCH_SEED):
+    """Board after n_moves random legal plies, identical across runs.
 
-def test_minimax():
-    """Test minimax algorithms"""
-    print("Testing Minimax Algorithms...")
-    
-    # Create a test board
-    board = create_empty_board()
-    
-    # Make a few moves
-    result = drop_piece(board, 3, 1)  # Player 1 in center
-    if result:
-        row, board = result
-        print(f"Player 1 placed at row {row}, col 3")
-    
-    result = drop_piece(board, 3, 2)  # Player 2 in center
-    if result:
-        row, board = result
-        print(f"Player 2 placed at row {row}, col 3")
-    
-    # Test minimax without alpha-beta
-    print("\n--- Minimax without Alpha-Beta ---")
+    Bumps the seed and restarts if the random line hits a terminal
+    position, so the returned board always has a move to search.
+    """
+    while True:
+        rng = random.Random(seed)
+        board = create_empty_board()
+        player = 1
+        for _ in range(n_moves):
+            col = rng.choice(get_valid_moves(board))
+            row, board = drop_piece(board, col, player)
+            player = 3 - player
+        terminal, _ = is_terminal(board)
+        if not terminal:
+            return board
+        seed += 1
+
+
+def _fresh_search_state():
+    """Reset seed and tables so every call searches from scratch."""
+    set_seed(BENCH_SEED)
+    clear_tt()
+    clear_killers()
+
+
+def test_minimax_without_ab():
+    board = _seeded_board()
+    _fresh_search_state()
     stats = MinimaxStats()
-    value, move = minimax_without_ab(board, depth=3, maximizing_player=True, player=1, stats=stats)
-    print(f"Best move: {move}, Value: {value}")
-    print(f"Nodes expanded: {stats.nodes_expanded}")
-    
-    # Test minimax with alpha-beta
-    print("\n--- Minimax with Alpha-Beta ---")
+    value, move = minimax_without_ab(board, depth=3, maximizing_player=True,
+                                     player=1, stats=stats)
+    assert move in get_valid_moves(board)
+    assert stats.nodes_expanded > 0
+
+
+def test_minimax_with_ab_matches_plain_value():
+    # Alpha-beta pruning may pick a different equal-valued move, but the
+    # root value must match the unpruned search
+    board = _seeded_board()
+    _fresh_search_state()
+    plain_value, _ = minimax_without_ab(board, depth=3, maximizing_player=True,
+                                        player=1, stats=MinimaxStats())
+    _fresh_search_state()
     stats = MinimaxStats()
-    value, move = minimax_with_ab(
-        board, depth=3, alpha=float('-inf'), beta=float('inf'),
+    ab_value, move = minimax_with_ab(
+        board, depth=3, alpha=-math.inf, beta=math.inf,
         maximizing_player=True, player=1, stats=stats
     )
-    print(f"Best move: {move}, Value: {value}")
-    print(f"Nodes expanded: {stats.nodes_expanded}")
-    print(f"Pruned nodes: {stats.pruned_nodes}")
-    
-    # Test iterative deepening
-    print("\n--- Iterative Deepening ---")
-    move, depth, stats = iterative_deepening(board, max_depth=5, player=1, time_limit=2.0)
-    print(f"Best move: {move}, Final depth: {depth}")
-    print(f"Nodes expanded: {stats.nodes_expanded}")
-    print(f"Pruned nodes: {stats.pruned_nodes}")
-    
-    print("\nAll tests completed!")
+    assert ab_value == plain_value
+    assert move in get_valid_moves(board)
+    assert stats.nodes_expanded > 0
 
-if __name__ == '__main__':
-    test_minimax()
 
+def test_iterative_deepening():
+    board = _seeded_board()
+    _fresh_search_state()
+    move, depth, stats = iterative_deepening(board, max_depth=5, player=1,
+                                             time_limit=2.0)
+    assert move in get_valid_moves(board)
+    assert depth >= 1
+    assert stats.nodes_expanded > 0
+
+
+def _bench(label, fn, warmup=BENCH_WARMUP, iters=BENCH_ITERS):
+    """Report median/min/max wall time of fn over warm+measured runs."""
+    for _ in range(warmup):
+        fn()
+    samples = []
+    for _ in range(iters):
+        start = time.perf_counter_ns()
+        fn()
+        samples.append(time.perf_counter_ns() - start)
+    print(f"  {label}: median {statistics.median(samples) / 1e6:.2f} ms, "
+          f"min {min(samples) / 1e6:.2f} ms, "
+          f"max {max(samples) / 1e6:.2f} ms  (n={iters})")
+
+
+def run_benchmarks():
+    """Micro-benchmark the three search entry points on a seeded board"""
+    board = _seeded_board()
+
+    def bench_without_ab():
+        _fresh_search_state()
+        minimax_without_ab(board, depth=3, maximizing_player=True,
+                           player=1, stats=MinimaxStats())
+
+    def bench_with_ab():
+        _fresh_search_state()
+        minimax_with_ab(board, depth=5, alpha=-math.inf, beta=math.inf,
+                        maximizing_player=True, player=1, stats=MinimaxStats())
+
+    def bench_iterative():
+        _fresh_search_state()
+        iterative_deepening(board, max_depth=5, player=1, time_limit=2.0)
+
+    print("Benchmarks (seeded mid-game board):")
+    _bench("minimax_without_ab depth=3", bench_without_ab)
+    _bench("minimax_with_ab depth=5", bench_with_ab)
+    _bench("iterative_deepening max_depth=5", bench_iterative)
+
+
+if __name__ == '__main__':
+    print("Running correctness checks...")
+    test_minimax_without_ab()
+    test_minimax_with_ab_matches_plain_value()
+    test_iterative_deepening()
+    print("All tests passed!\n")
+    run_benchmarks()